@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class AiCoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "jagalchi_ai.ai_core"
+
+    def ready(self) -> None:
+        """
+        프로세스 시작 시 한 번 실행되는 초기화 훅입니다.
+
+        @returns None
+        """
+        from django.conf import settings
+
+        # 파일 로그 핸들러는 첫 기록 시점에 파일을 열기 때문에 디렉토리만 미리 준비합니다.
+        settings.LOG_DIR.mkdir(parents=True, exist_ok=True)
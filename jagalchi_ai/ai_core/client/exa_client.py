@@ -35,6 +35,7 @@ import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional, Union
 
 # -----------------------------------------------------------------------------
@@ -318,6 +319,25 @@ def create_retry_decorator(
         return passthrough
 
 
+# =============================================================================
+# 공유 SDK 클라이언트
+# =============================================================================
+
+
+@lru_cache(maxsize=8)
+def _shared_exa_client(api_key: str) -> Any:
+    """
+    API 키별로 하나의 Exa SDK 클라이언트를 공유합니다.
+
+    Exa 객체는 생성 시 여러 하위 네임스페이스 클라이언트를 함께 만들므로,
+    요청마다 ExaSearchClient가 생성되어도 SDK 객체는 한 번만 만듭니다.
+
+    @param {str} api_key - Exa API 키.
+    @returns {Exa} 공유 Exa SDK 클라이언트.
+    """
+    return Exa(api_key)
+
+
 # =============================================================================
 # Exa 검색 클라이언트 클래스
 # =============================================================================
@@ -416,7 +436,7 @@ class ExaSearchClient:
         self._client: Optional[Any] = None
         if self._api_key and EXA_AVAILABLE:
             try:
-                self._client = Exa(self._api_key)
+                self._client = _shared_exa_client(self._api_key)
                 logger.info("Exa 검색 클라이언트 초기화 성공")
             except Exception as e:
                 logger.error(
@@ -40,13 +40,15 @@ import asyncio
 import logging
 import os
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Callable, Dict, List, Optional, Union
 
 # -----------------------------------------------------------------------------
 # 서드파티 라이브러리 (조건부 임포트 및 타입 체크)
 # -----------------------------------------------------------------------------
 try:
+    import requests
+    from requests.adapters import HTTPAdapter
     from tavily import TavilyClient
     TAVILY_AVAILABLE = True
 except ImportError:
@@ -108,6 +110,10 @@ DEFAULT_MAX_RESULTS = 5
 DEFAULT_TIMEOUT = 30
 DEFAULT_MAX_RETRIES = 3
 
+# 공유 HTTP 세션 커넥션 풀 크기
+POOL_CONNECTIONS = 20
+POOL_MAXSIZE = 50
+
 
 # -----------------------------------------------------------------------------
 # Pydantic 모델 정의 (데이터 검증 및 직렬화)
@@ -237,6 +243,28 @@ def create_retry_decorator(
     return fallback_decorator
 
 
+# -----------------------------------------------------------------------------
+# 유틸리티: 공유 SDK 클라이언트
+# -----------------------------------------------------------------------------
+@lru_cache(maxsize=8)
+def _shared_tavily_client(api_key: str) -> "TavilyClient":
+    """
+    API 키별로 하나의 Tavily SDK 클라이언트를 공유합니다.
+
+    요청마다 TavilySearchClient가 새로 만들어져도 같은 requests.Session(keep-alive 커넥션 풀)을
+    재사용하므로 TCP/TLS 핸드셰이크가 요청마다 반복되지 않습니다. 재시도는 tenacity가
+    담당하므로 어댑터 재시도는 끕니다.
+
+    @param {str} api_key - Tavily API 키.
+    @returns {TavilyClient} 공유 Tavily SDK 클라이언트.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return TavilyClient(api_key=api_key, session=session)
+
+
 # -----------------------------------------------------------------------------
 # Tavily 검색 클라이언트 클래스
 # -----------------------------------------------------------------------------
@@ -302,7 +330,7 @@ class TavilySearchClient:
             return
 
         try:
-            self._client = TavilyClient(api_key=self._api_key)
+            self._client = _shared_tavily_client(self._api_key)
             logger.info("Tavily 검색 클라이언트가 성공적으로 초기화되었습니다.")
         except Exception as e:
             logger.error(f"Tavily 클라이언트 초기화 중 오류 발생: {e}")
@@ -1,6 +1,6 @@
 import hashlib
 import json
-from typing import Any
+from typing import Any, Iterable
 
 
 def stable_hash_text(text: str) -> str:
@@ -18,3 +18,17 @@ def stable_hash_json(payload: Any) -> str:
     """
     canonical = json.dumps(payload, ensure_ascii=True, sort_keys=True, separators=(",", ":"))
     return stable_hash_text(canonical)
+
+
+def stable_hash_fields(records: Iterable[Iterable[str]]) -> str:
+    """
+    @param records 해시 대상 문자열 필드 묶음 시퀀스.
+    @returns 중간 JSON 직렬화 없이 필드/레코드 구분자와 함께 스트리밍한 BLAKE2b 해시 문자열.
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    for record in records:
+        for value in record:
+            digest.update(value.encode("utf-8"))
+            digest.update(b"\x00")
+        digest.update(b"\x01")
+    return digest.hexdigest()
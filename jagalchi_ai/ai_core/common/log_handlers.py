@@ -0,0 +1,136 @@
+import atexit
+import json
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, List
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# LogRecord 기본 속성 (extra로 전달된 필드만 골라내기 위해 사용)
+_RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_HANDLERS: List["QueuedRotatingFileHandler"] = []
+
+
+class ORJSONFormatter(logging.Formatter):
+    """asctime/levelname/name/message와 extra 필드를 한 줄 JSON으로 기록하는 포매터."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        @param record 로그 레코드.
+        @returns JSON 문자열.
+        """
+        payload: Dict[str, Any] = {
+            "asctime": self.formatTime(record, self.datefmt),
+            "levelname": record.levelname,
+            "name": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(payload, default=str).decode("utf-8")
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class QueuedRotatingFileHandler(QueueHandler):
+    """
+    요청 스레드에서는 큐에 넣기만 하고, 파일 쓰기/로테이션은 백그라운드 리스너가 수행하는 핸들러.
+
+    포맷은 큐에 넣기 전에 이 핸들러의 포매터로 끝내며, 리스너는 완성된 문자열만 기록합니다.
+    리스너 스레드는 첫 레코드가 들어올 때 시작하므로, 로거에 연결되지 않은 핸들러는 스레드를 만들지 않습니다.
+    RotatingFileHandler는 프로세스 간 로테이션을 조율하지 않으므로 워커마다 다른 파일을 지정해야 합니다.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: str = "utf-8",
+    ) -> None:
+        """
+        @param filename 로그 파일 경로.
+        @param maxBytes 로테이션 기준 파일 크기(바이트).
+        @param backupCount 보관할 백업 파일 수.
+        @param encoding 파일 인코딩.
+        @returns None
+        """
+        super().__init__(queue.SimpleQueue())
+        target = RotatingFileHandler(
+            filename,
+            maxBytes=maxBytes,
+            backupCount=backupCount,
+            encoding=encoding,
+            delay=True,
+        )
+        self.listener = QueueListener(self.queue, target, respect_handler_level=False)
+        self._started = False
+        _HANDLERS.append(self)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        @param record 로그 레코드.
+        @returns None
+        """
+        if not self._started:
+            self.start_listener()
+        super().emit(record)
+
+    def start_listener(self) -> None:
+        """
+        리스너 스레드를 시작합니다. 이미 시작했다면 아무것도 하지 않습니다.
+
+        @returns None
+        """
+        with self.lock:
+            if not self._started:
+                self.listener.start()
+                self._started = True
+
+    def stop_listener(self) -> None:
+        """
+        큐에 남은 레코드를 모두 기록하고 리스너 스레드를 종료합니다.
+
+        @returns None
+        """
+        with self.lock:
+            if self._started:
+                self.listener.stop()
+                self._started = False
+
+    def close(self) -> None:
+        """
+        리스너를 멈추고 등록을 해제한 뒤 대상 파일 핸들러를 닫습니다.
+
+        @returns None
+        """
+        self.stop_listener()
+        if self in _HANDLERS:
+            _HANDLERS.remove(self)
+        for target in self.listener.handlers:
+            target.close()
+        super().close()
+
+
+def stop_log_listeners() -> None:
+    """
+    프로세스 종료 시 실행 중인 모든 리스너의 남은 레코드를 기록하고 종료합니다.
+
+    @returns None
+    """
+    for handler in list(_HANDLERS):
+        handler.stop_listener()
+
+
+atexit.register(stop_log_listeners)
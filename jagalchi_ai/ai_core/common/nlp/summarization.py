@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import math
-from typing import Dict, List, Optional
+from typing import List, Optional
+
+import numpy as np
 
 from jagalchi_ai.ai_core.client import GeminiClient
 from jagalchi_ai.ai_core.common.nlp.text_utils import extract_sentences, tokenize
@@ -21,8 +22,9 @@ def textrank_sentences(text: str, top_n: int = 2) -> List[str]:
 
     similarity = _sentence_similarity(sentences)
     scores = _pagerank(similarity)
-    ranked = sorted(range(len(sentences)), key=lambda idx: scores[idx], reverse=True)
-    selected = sorted(ranked[:top_n])
+    # 부동소수점 오차로 동점 문장의 순서가 뒤바뀌지 않도록 반올림 후 안정 정렬한다.
+    ranked = np.argsort(-np.round(scores, 12), kind="stable")[:top_n]
+    selected = sorted(int(idx) for idx in ranked)
     return [sentences[idx] for idx in selected]
 
 
@@ -57,38 +59,36 @@ def map_reduce_summary(texts: List[str], llm_client: Optional[GeminiClient] = No
     return hybrid_summary(reduced, llm_client=llm_client, top_n=2)
 
 
-def _sentence_similarity(sentences: List[str]) -> List[List[float]]:
+def _sentence_similarity(sentences: List[str]) -> np.ndarray:
     """
     @param sentences 문장 리스트.
-    @returns 문장 간 유사도 행렬.
+    @returns 토큰 출현 행렬의 곱으로 한 번에 계산한 문장 간 Jaccard 유사도 행렬.
     """
-    tokens = [set(tokenize(sentence)) for sentence in sentences]
-    size = len(sentences)
-    matrix = [[0.0 for _ in range(size)] for _ in range(size)]
-    for i in range(size):
-        for j in range(size):
-            if i == j:
-                continue
-            intersection = tokens[i] & tokens[j]
-            union = tokens[i] | tokens[j]
-            matrix[i][j] = len(intersection) / max(len(union), 1)
+    token_sets = [set(tokenize(sentence)) for sentence in sentences]
+    vocab = {token: idx for idx, token in enumerate(set().union(*token_sets))}
+    incidence = np.zeros((len(sentences), len(vocab)), dtype=np.float64)
+    for row, tokens in enumerate(token_sets):
+        incidence[row, [vocab[token] for token in tokens]] = 1.0
+    intersection = incidence @ incidence.T
+    sizes = incidence.sum(axis=1)
+    union = sizes[:, None] + sizes[None, :] - intersection
+    matrix = intersection / np.maximum(union, 1.0)
+    np.fill_diagonal(matrix, 0.0)
     return matrix
 
 
-def _pagerank(similarity: List[List[float]], damping: float = 0.85, iterations: int = 20) -> Dict[int, float]:
+def _pagerank(similarity: np.ndarray, damping: float = 0.85, iterations: int = 20) -> np.ndarray:
     """
     @param similarity 유사도 행렬.
     @param damping 감쇠 계수.
     @param iterations 반복 횟수.
-    @returns 문장 인덱스별 PageRank 점수.
+    @returns 문장 인덱스별 PageRank 점수 배열.
     """
     size = len(similarity)
-    scores = {idx: 1.0 / size for idx in range(size)}
+    norms = similarity.sum(axis=1)
+    norms[norms == 0] = 1.0
+    transition = (similarity / norms[:, None]).T
+    scores = np.full(size, 1.0 / size)
     for _ in range(iterations):
-        next_scores = {idx: (1 - damping) / size for idx in range(size)}
-        for i in range(size):
-            norm = sum(similarity[i]) or 1.0
-            for j in range(size):
-                next_scores[j] += damping * (similarity[i][j] / norm) * scores[i]
-        scores = next_scores
+        scores = (1 - damping) / size + damping * (transition @ scores)
     return scores
@@ -1,12 +1,16 @@
 import re
-from collections import Counter
-from typing import Iterable, List
+from collections import Counter, OrderedDict
+from threading import Lock
+from typing import Dict, Iterable, List, Set, Tuple
 
 from sklearn.feature_extraction.text import HashingVectorizer
 
 _WORD_RE = re.compile(r"[\w\-\+\.]+", re.UNICODE)
 _SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
 _VECTORIZER_CACHE: dict[int, HashingVectorizer] = {}
+_EMBED_CACHE_MAXSIZE = 100_000
+_EMBED_CACHE: "OrderedDict[Tuple[str, int], Tuple[float, ...]]" = OrderedDict()
+_EMBED_CACHE_LOCK = Lock()
 
 
 def normalize_text(text: str) -> str:
@@ -25,6 +29,14 @@ def tokenize(text: str) -> List[str]:
     return [token.lower() for token in _WORD_RE.findall(text)]
 
 
+def token_set(text: str) -> Set[str]:
+    """
+    @param text 토큰화할 문자열.
+    @returns 문자열을 한 번에 소문자화한 뒤 바로 구성한 토큰 집합.
+    """
+    return set(_WORD_RE.findall(text.lower()))
+
+
 def token_counts(text: str) -> Counter:
     """
     @param text 토큰 빈도 계산 대상 문자열.
@@ -105,6 +117,57 @@ def cheap_embed(text: str, dim: int = 32) -> List[float]:
     return dense[0].tolist() if len(dense) else [0.0] * dim
 
 
+def cheap_embed_batch(texts: List[str], dim: int = 32) -> List[List[float]]:
+    """
+    @param texts 임베딩할 문자열 리스트.
+    @param dim 임베딩 차원.
+    @returns 입력 순서와 동일한 해시 기반 경량 임베딩 벡터 리스트.
+    """
+    if not texts:
+        return []
+    vectorizer = _get_vectorizer(dim)
+    dense = vectorizer.transform(texts).toarray()
+    return [
+        row.tolist() if text.strip() else [0.0] * dim
+        for text, row in zip(texts, dense)
+    ]
+
+
+def cached_cheap_embed(text: str, dim: int = 32) -> List[float]:
+    """
+    @param text 임베딩할 문자열.
+    @param dim 임베딩 차원.
+    @returns 동일 텍스트는 LRU 캐시에서 재사용하는 경량 임베딩 벡터.
+    """
+    return cached_cheap_embed_batch([text], dim=dim)[0]
+
+
+def cached_cheap_embed_batch(texts: List[str], dim: int = 32) -> List[List[float]]:
+    """
+    @param texts 임베딩할 문자열 리스트.
+    @param dim 임베딩 차원.
+    @returns 캐시 미스만 한 번에 배치 임베딩한 벡터 리스트.
+    """
+    keys = [text.strip() for text in texts]
+    resolved: Dict[str, Tuple[float, ...]] = {}
+    with _EMBED_CACHE_LOCK:
+        for key in keys:
+            cached = _EMBED_CACHE.get((key, dim))
+            if cached is not None:
+                _EMBED_CACHE.move_to_end((key, dim))
+                resolved[key] = cached
+    missing = [key for key in dict.fromkeys(keys) if key not in resolved]
+    if missing:
+        computed = {key: tuple(vector) for key, vector in zip(missing, cheap_embed_batch(missing, dim=dim))}
+        resolved.update(computed)
+        with _EMBED_CACHE_LOCK:
+            for key, vector in computed.items():
+                _EMBED_CACHE[(key, dim)] = vector
+            while len(_EMBED_CACHE) > _EMBED_CACHE_MAXSIZE:
+                _EMBED_CACHE.popitem(last=False)
+    return [list(resolved[key]) for key in keys]
+
+
 def _get_vectorizer(dim: int) -> HashingVectorizer:
     """
     @param dim 해시 벡터 차원.
@@ -1,4 +1,5 @@
 from jagalchi_ai.ai_core.config.model_router import ModelRouter
 from jagalchi_ai.ai_core.config.routing_decision import RoutingDecision
+from jagalchi_ai.ai_core.config.secrets import api_key
 
-__all__ = ["ModelRouter", "RoutingDecision"]
+__all__ = ["ModelRouter", "RoutingDecision", "api_key"]
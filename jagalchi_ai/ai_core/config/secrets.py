@@ -0,0 +1,21 @@
+from functools import lru_cache
+
+from django.conf import settings
+
+
+@lru_cache(maxsize=None)
+def api_key(name: str) -> str:
+    """
+    Django 설정에 SecretStr로 보관된 API 키를 처음 요청될 때 한 번만 평문으로 꺼냅니다.
+
+    테스트 등에서 설정을 바꾼 뒤 다시 읽어야 하면 `api_key.cache_clear()`를 호출합니다.
+
+    @param name 설정 이름 (예: "GEMINI_API_KEY").
+    @returns API 키 문자열 (설정되지 않았으면 빈 문자열).
+    """
+    secret = getattr(settings, name, None)
+    if secret is None:
+        return ""
+    if isinstance(secret, str):
+        return secret
+    return secret.get_secret_value()
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict
 
+from django.conf import settings
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_headers
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from drf_spectacular.utils import OpenApiExample, OpenApiParameter, OpenApiTypes, extend_schema
@@ -22,6 +27,7 @@ from jagalchi_ai.ai_core.service.tech.tech_cards import TechCardService
 from jagalchi_ai.ai_core.service.tech.tech_fingerprint import TechFingerprintService
 from jagalchi_ai.ai_core.service.roadmap_management.init_data_service import InitDataService
 from jagalchi_ai.ai_core.service.content_generation.node_content_service import NodeContentService
+from jagalchi_ai.ai_core.controller.pagination import TimeCursorPagination
 from jagalchi_ai.ai_core.controller.serializers import (
     CommentDigestSerializer,
     DemoResponseSerializer,
@@ -30,6 +36,7 @@ from jagalchi_ai.ai_core.controller.serializers import (
     GraphRAGContextSerializer,
     HealthCheckSerializer,
     InitDataCreateSerializer,
+    InitDataPageSerializer,
     InitDataSerializer,
     InitDataUpdateSerializer,
     LearningCoachSerializer,
@@ -47,6 +54,9 @@ from jagalchi_ai.ai_core.controller.serializers import (
     WebSearchSerializer,
 )
 
+# 느리게 바뀌는 조회 API 응답 캐시 시간(초)
+VIEW_CACHE_SECONDS = 60
+
 
 class DemoAIAPIView(APIView):
     """전체 AI 기능을 한 번에 확인하는 데모 엔드포인트."""
@@ -211,6 +221,8 @@ class RecordCoachAPIView(APIView):
         return _serialize(RecordCoachSerializer, payload)
 
 
+@method_decorator(cache_page(VIEW_CACHE_SECONDS), name="get")
+@method_decorator(vary_on_headers("Accept-Language"), name="get")
 class RelatedRoadmapsAPIView(APIView):
     """연관 로드맵 추천 응답."""
 
@@ -237,6 +249,8 @@ class RelatedRoadmapsAPIView(APIView):
         return _serialize(RelatedRoadmapsSerializer, payload)
 
 
+@method_decorator(cache_page(VIEW_CACHE_SECONDS), name="get")
+@method_decorator(vary_on_headers("Accept-Language"), name="get")
 class TechCardAPIView(APIView):
     """기술 카드 응답."""
 
@@ -677,6 +691,29 @@ def _resource_recommendation(query: str, top_k: int, recency_days: int | None):
     return ResourceRecommendationService().recommend(query, top_k=top_k, recency_days=recency_days)
 
 
+def _web_search_snapshot_store():
+    """
+    @returns SNAPSHOT_BACKEND 설정에 따른 웹 검색 스냅샷 저장소(LMDB 또는 워커 간 공유 캐시).
+    """
+    if settings.SNAPSHOT_BACKEND == "lmdb":
+        return _lmdb_snapshot_store()
+    from jagalchi_ai.ai_core.repository.cache_snapshot_store import CacheSnapshotStore
+
+    return CacheSnapshotStore(namespace="web_search")
+
+
+@lru_cache(maxsize=1)
+def _lmdb_snapshot_store():
+    """
+    같은 프로세스에서 LMDB 환경을 두 번 열 수 없으므로 프로세스당 한 번만 엽니다.
+
+    @returns 프로세스 공유 LMDBSnapshotStore.
+    """
+    from jagalchi_ai.ai_core.repository.lmdb_snapshot_store import LMDBSnapshotStore
+
+    return LMDBSnapshotStore(ttl_seconds=settings.CACHE_TIMEOUT)
+
+
 def _learning_pattern(user_id: str):
     """
     @param user_id 사용자 ID.
@@ -819,8 +856,8 @@ class WebSearchAPIView(APIView):
         }
         engine = engine_map.get(engine_param, SearchEngine.ALL)
 
-        # 검색 수행
-        service = WebSearchService()
+        # 검색 수행 (SNAPSHOT_BACKEND에 따라 공유 캐시 또는 LMDB에 스냅샷 저장)
+        service = WebSearchService(snapshot_store=_web_search_snapshot_store())
         search_kwargs = {"query": query, "top_k": top_k, "engine": engine}
         if recency_days_param is not None:
             search_kwargs["recency_days"] = int(recency_days_param)
@@ -1073,17 +1110,21 @@ class InitDataListCreateAPIView(APIView):
 
     @extend_schema(
         summary="Init Data 목록 조회",
-        parameters=[OpenApiParameter("roadmap_id", OpenApiTypes.STR, required=True, description="로드맵 ID")],
-        responses={200: InitDataSerializer(many=True)},
+        parameters=[
+            OpenApiParameter("roadmap_id", OpenApiTypes.STR, required=True, description="로드맵 ID"),
+            OpenApiParameter("cursor", OpenApiTypes.STR, required=False, description="다음/이전 페이지 커서"),
+        ],
+        responses={200: InitDataPageSerializer},
     )
     def get(self, request) -> Response:
         roadmap_id = request.GET.get("roadmap_id")
         if not roadmap_id:
             return Response({"error": "roadmap_id required"}, status=400)
-        
-        service = InitDataService()
-        data = service.get_list_by_roadmap(roadmap_id)
-        return _serialize(InitDataSerializer, data, many=True)
+
+        # (roadmap_id, -created_at) 인덱스 범위 조회로 한 페이지씩 읽습니다(COUNT/OFFSET 없음).
+        paginator = TimeCursorPagination()
+        page = paginator.paginate_queryset(InitDataService().get_queryset_by_roadmap(roadmap_id), request, view=self)
+        return paginator.get_paginated_response(InitDataSerializer(page, many=True).data)
 
     @extend_schema(
         summary="Init Data 생성 (업로드/입력)",
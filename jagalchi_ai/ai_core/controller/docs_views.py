@@ -1,7 +1,45 @@
 from __future__ import annotations
 
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+from django.utils import translation
 from drf_spectacular.utils import OpenApiTypes, extend_schema
-from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
+from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
+from rest_framework.response import Response
+
+
+# OpenAPI 스키마를 프로세스당 한 번만 생성하는 스키마 뷰.
+# 스키마는 배포 단위로 고정이므로 (버전, 언어)별로 생성 결과를 보관하고,
+# 이후 요청은 뷰 인트로스펙션 없이 렌더링만 수행합니다.
+class CachedSchemaAPIView(SpectacularAPIView):
+    # 클래스 docstring은 스키마 엔드포인트 설명으로 노출되므로 원본 설명을 유지합니다.
+    __doc__ = SpectacularAPIView.__doc__
+
+    _schema_cache: Dict[Tuple[Optional[str], Optional[str]], Dict[str, Any]] = {}
+    _schema_lock = Lock()
+
+    def _get_schema_response(self, request) -> Response:
+        """
+        캐시된 스키마로 응답을 만듭니다. 캐시가 없으면 한 번 생성합니다.
+
+        @param {Request} request - DRF 요청 객체.
+        @returns {Response} OpenAPI 스키마 응답.
+        """
+        version = self.api_version or request.version or self._get_version_parameter(request)
+        key = (version, translation.get_language())
+        schema = self._schema_cache.get(key)
+        if schema is None:
+            with self._schema_lock:
+                schema = self._schema_cache.get(key)
+                if schema is None:
+                    generator = self.generator_class(urlconf=self.urlconf, api_version=version, patterns=self.patterns)
+                    schema = generator.get_schema(request=request, public=self.serve_public)
+                    self._schema_cache[key] = schema
+        return Response(
+            data=schema,
+            headers={"Content-Disposition": f'inline; filename="{self._get_filename(request, version)}"'},
+        )
 
 
 class SwaggerUIView(SpectacularSwaggerView):
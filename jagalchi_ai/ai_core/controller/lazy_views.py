@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from django.utils.module_loading import import_string
+
+
+class LazyView:
+    """
+    첫 요청 시점에 뷰 클래스를 임포트하는 URL 콜백.
+
+    ai_views는 로드 시 서비스/클라이언트 모듈을 연쇄적으로 임포트하므로,
+    urls.py에서는 점 경로만 등록해 두고 실제로 라우트가 호출될 때 뷰를 구성합니다.
+    `cls`/`initkwargs`를 노출해 DRF/drf-spectacular 스키마 생성기도 그대로 동작합니다.
+    """
+
+    # APIView.as_view()는 항상 csrf_exempt 뷰를 반환하므로 미들웨어에도 동일하게 알립니다.
+    csrf_exempt = True
+
+    def __init__(self, dotted_path: str, decorators: Sequence[Callable[[Callable], Callable]] = ()) -> None:
+        """
+        @param {str} dotted_path - 뷰 클래스 점 경로.
+        @param {Sequence[Callable]} decorators - as_view() 결과에 적용할 데코레이터(바깥쪽부터).
+        @returns {None} 콜백을 초기화합니다.
+        """
+        self._dotted_path = dotted_path
+        self._decorators = tuple(decorators)
+        self._view: Optional[Callable[..., Any]] = None
+        self._lock = Lock()
+
+    @property
+    def cls(self) -> type:
+        """
+        @returns {type} 점 경로가 가리키는 뷰 클래스.
+        """
+        return import_string(self._dotted_path)
+
+    @property
+    def initkwargs(self) -> Dict[str, Any]:
+        """
+        @returns {Dict[str, Any]} as_view()에 전달하는 초기화 인자(없음).
+        """
+        return {}
+
+    def __call__(self, request: Any, *args: Any, **kwargs: Any) -> Any:
+        """
+        @param {HttpRequest} request - Django 요청 객체.
+        @returns {HttpResponse} 실제 뷰의 응답.
+        """
+        return self._resolve()(request, *args, **kwargs)
+
+    def __repr__(self) -> str:
+        """
+        @returns {str} 디버깅용 문자열 표현.
+        """
+        return f"LazyView({self._dotted_path!r})"
+
+    def _resolve(self) -> Callable[..., Any]:
+        """
+        @returns {Callable} 데코레이터가 적용된 as_view() 콜백(한 번만 구성).
+        """
+        if self._view is None:
+            with self._lock:
+                if self._view is None:
+                    view = self.cls.as_view()
+                    for decorator in reversed(self._decorators):
+                        view = decorator(view)
+                    self._view = view
+        return self._view
+
+
+def lazy_view(name: str, decorators: Sequence[Callable[[Callable], Callable]] = ()) -> LazyView:
+    """
+    ai_views 모듈의 뷰를 지연 임포트하는 콜백을 만듭니다.
+
+    @param {str} name - ai_views 내 뷰 클래스 이름.
+    @param {Sequence[Callable]} decorators - as_view() 결과에 적용할 데코레이터.
+    @returns {LazyView} URL 패턴에 등록할 콜백.
+    """
+    return LazyView(f"jagalchi_ai.ai_core.controller.ai_views.{name}", decorators)
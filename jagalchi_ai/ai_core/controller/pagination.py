@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from rest_framework.pagination import CursorPagination
+
+
+class TimeCursorPagination(CursorPagination):
+    """
+    생성 시각(created_at) 기준 커서 페이지네이션.
+
+    PageNumberPagination과 달리 COUNT(*)와 OFFSET 스캔이 없어, created_at 인덱스 위의
+    범위 조회만으로 페이지를 가져옵니다. 전체 개수가 꼭 필요한 뷰는 뷰 단위로
+    pagination_class를 재정의합니다.
+    """
+
+    ordering = "-created_at"
+    page_size = 20
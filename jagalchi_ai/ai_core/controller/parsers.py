@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import codecs
+from typing import Any, Mapping, Optional
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from jagalchi_ai.ai_core.controller.renderers import ORJSON_AVAILABLE, ORJSONRenderer, orjson
+
+
+class ORJSONParser(JSONParser):
+    """
+    orjson 기반 JSON 파서.
+
+    UTF-8 요청 본문은 orjson으로 한 번에 파싱하고, 그 외 인코딩이거나 orjson이
+    설치되지 않은 경우에는 DRF 기본 파서로 폴백합니다.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream: Any, media_type: Optional[str] = None, parser_context: Optional[Mapping[str, Any]] = None) -> Any:
+        """
+        요청 본문 스트림을 JSON으로 파싱합니다.
+
+        @param {Any} stream - 요청 본문 스트림.
+        @param {Optional[str]} media_type - 요청 미디어 타입.
+        @param {Optional[Mapping[str, Any]]} parser_context - 파서 컨텍스트.
+        @returns {Any} 파싱된 데이터.
+        """
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if not ORJSON_AVAILABLE or not self.strict or codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
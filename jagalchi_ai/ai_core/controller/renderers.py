@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import Any, Mapping, Optional
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+_LINE_SEPARATOR = "\u2028".encode()
+_PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    orjson 기반 JSON 렌더러.
+
+    출력 형식은 DRF JSONRenderer(UNICODE_JSON/COMPACT_JSON)와 동일하게 유지하고,
+    orjson이 직접 처리하지 못하는 타입(datetime, Decimal, UUID, lazy 문자열 등)은
+    DRF 인코더에 위임합니다. 들여쓰기가 필요한 경우(Browsable API 등)나 orjson이
+    설치되지 않은 경우에는 기본 렌더러로 폴백합니다.
+    """
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[Mapping[str, Any]] = None,
+    ) -> bytes:
+        """
+        응답 데이터를 JSON 바이트열로 직렬화합니다.
+
+        @param {Any} data - 직렬화할 응답 데이터.
+        @param {Optional[str]} accepted_media_type - 협상된 미디어 타입.
+        @param {Optional[Mapping[str, Any]]} renderer_context - 렌더러 컨텍스트.
+        @returns {bytes} UTF-8 JSON 바이트열.
+        """
+        if data is None:
+            return b""
+        renderer_context = renderer_context or {}
+        if (
+            not ORJSON_AVAILABLE
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        rendered = orjson.dumps(
+            data,
+            default=self.encoder_class().default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+        # DRF와 동일하게 U+2028/U+2029를 이스케이프해 JavaScript 부분집합을 유지한다.
+        if _LINE_SEPARATOR in rendered or _PARAGRAPH_SEPARATOR in rendered:
+            rendered = rendered.replace(_LINE_SEPARATOR, b"\\u2028").replace(_PARAGRAPH_SEPARATOR, b"\\u2029")
+        return rendered
@@ -365,6 +365,13 @@ class InitDataSerializer(serializers.Serializer):
     updated_at = serializers.DateTimeField()
 
 
+class InitDataPageSerializer(serializers.Serializer):
+    """Init 데이터 목록 커서 페이지 응답 시리얼라이저."""
+    next = serializers.URLField(allow_null=True)
+    previous = serializers.URLField(allow_null=True)
+    results = InitDataSerializer(many=True)
+
+
 class InitDataCreateSerializer(serializers.Serializer):
     """Init 데이터 생성 요청 시리얼라이저."""
     roadmap_id = serializers.CharField()
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from django.core.cache import caches
+from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
+
+
+class LocalAnonRateThrottle(AnonRateThrottle):
+    """워커 로컬 `throttle` 캐시를 사용하는 익명 사용자 요청 제한."""
+
+    cache = caches["throttle"]
+
+
+class LocalUserRateThrottle(UserRateThrottle):
+    """워커 로컬 `throttle` 캐시를 사용하는 인증 사용자 요청 제한."""
+
+    cache = caches["throttle"]
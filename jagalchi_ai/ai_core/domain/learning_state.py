@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Optional
 
 
@@ -11,5 +10,5 @@ class LearningState:
 
     status: str
     proficiency: float
-    last_reviewed: Optional[datetime]
+    last_reviewed: Optional[int]  # UTC epoch 초
     decay_factor: float
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-17 05:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='initdata',
+            index=models.Index(fields=['roadmap_id', '-created_at'], name='ai_init_dat_roadmap_63cc0b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='noderesource',
+            index=models.Index(fields=['node_id', '-created_at'], name='ai_node_res_node_id_7dbe75_idx'),
+        ),
+    ]
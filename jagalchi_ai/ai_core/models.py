@@ -37,6 +37,8 @@ class InitData(models.Model):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["roadmap_id"]),
+            # roadmap_id로 필터링하고 최신순으로 커서 페이지를 읽는 목록 조회용
+            models.Index(fields=["roadmap_id", "-created_at"]),
         ]
 
     def __str__(self):
@@ -69,6 +71,8 @@ class NodeResource(models.Model):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["node_id"]),
+            # node_id로 필터링하고 최신순으로 읽는 목록 조회용
+            models.Index(fields=["node_id", "-created_at"]),
         ]
 
     def __str__(self):
@@ -1,9 +1,25 @@
-from jagalchi_ai.ai_core.repository.graph_store import GraphStore
-from jagalchi_ai.ai_core.repository.in_memory_vector_store import InMemoryVectorStore
-from jagalchi_ai.ai_core.repository.semantic_cache import SemanticCache
-from jagalchi_ai.ai_core.repository.snapshot import Snapshot
-from jagalchi_ai.ai_core.repository.snapshot_store import SnapshotStore
-from jagalchi_ai.ai_core.repository.vector_store import VectorStore
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - 타입 검사 전용 import
+    from jagalchi_ai.ai_core.repository.graph_store import GraphStore
+    from jagalchi_ai.ai_core.repository.in_memory_vector_store import InMemoryVectorStore
+    from jagalchi_ai.ai_core.repository.semantic_cache import SemanticCache
+    from jagalchi_ai.ai_core.repository.snapshot import Snapshot
+    from jagalchi_ai.ai_core.repository.snapshot_store import SnapshotStore
+    from jagalchi_ai.ai_core.repository.vector_store import VectorStore
+
+# mock_data 등 가벼운 하위 모듈만 필요한 경우 FAISS/scikit-learn 로딩을 피하도록 지연 import한다.
+_LAZY_EXPORTS = {
+    "GraphStore": "jagalchi_ai.ai_core.repository.graph_store",
+    "InMemoryVectorStore": "jagalchi_ai.ai_core.repository.in_memory_vector_store",
+    "SemanticCache": "jagalchi_ai.ai_core.repository.semantic_cache",
+    "Snapshot": "jagalchi_ai.ai_core.repository.snapshot",
+    "SnapshotStore": "jagalchi_ai.ai_core.repository.snapshot_store",
+    "VectorStore": "jagalchi_ai.ai_core.repository.vector_store",
+}
 
 __all__ = [
     "GraphStore",
@@ -13,3 +29,16 @@ __all__ = [
     "SnapshotStore",
     "VectorStore",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    @param name 요청된 공개 심볼 이름.
+    @returns 처음 접근할 때 import한 클래스.
+    """
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, Optional, Set
+
+from django.core.cache import caches
+
+from jagalchi_ai.ai_core.repository.snapshot import Snapshot
+from jagalchi_ai.ai_core.repository.snapshot_store import SnapshotStore
+
+
+class CacheSnapshotStore(SnapshotStore):
+    """
+    Django 캐시 백엔드(Redis/Memcached 등)를 공유 저장소로 사용하는 스냅샷 저장소.
+
+    get/put/clear/size를 모두 캐시 백엔드로 처리하므로 `SnapshotStore.__init__`은 호출하지 않습니다.
+    """
+
+    def __init__(self, namespace: str = "snapshot", alias: str = "default", timeout: Optional[int] = None) -> None:
+        """
+        @param namespace 캐시 키 접두사.
+        @param alias 사용할 CACHES 별칭.
+        @param timeout 스냅샷 만료 시간(초, 없으면 백엔드 기본값).
+        @returns None
+        """
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache = caches[alias]
+        self._namespace = namespace
+        self._timeout = timeout
+        self._keys: Set[str] = set()
+
+    def get(self, key: str) -> Optional[Snapshot]:
+        """
+        @param key 스냅샷 키.
+        @returns 캐시된 스냅샷 또는 None.
+        """
+        snapshot = self._cache.get(self._cache_key(key))
+        if snapshot:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return snapshot
+
+    def put(self, key: str, payload: Dict[str, Any], version: str, metadata: Optional[Dict[str, Any]] = None) -> Snapshot:
+        """
+        @param key 스냅샷 키.
+        @param payload 저장할 결과 JSON.
+        @param version 결과 버전.
+        @param metadata 부가 메타데이터.
+        @returns 저장된 Snapshot 객체.
+        """
+        snapshot = Snapshot(
+            key=key,
+            payload=payload,
+            version=version,
+            created_at=datetime.utcnow(),
+            metadata=metadata or {},
+        )
+        if self._timeout is None:
+            self._cache.set(self._cache_key(key), snapshot)
+        else:
+            self._cache.set(self._cache_key(key), snapshot, self._timeout)
+        self._keys.add(key)
+        return snapshot
+
+    def clear(self) -> None:
+        """
+        이 저장소가 기록한 스냅샷과 히트/미스 통계를 초기화합니다.
+
+        @returns None
+        """
+        self._cache.delete_many([self._cache_key(key) for key in self._keys])
+        self._keys.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def size(self) -> int:
+        """
+        @returns 이 저장소가 기록한 스냅샷 개수(공유 백엔드 전체 개수는 조회하지 않음).
+        """
+        return len(self._keys)
+
+    def _cache_key(self, key: str) -> str:
+        """
+        @param key 스냅샷 키.
+        @returns 네임스페이스가 붙은 캐시 키.
+        """
+        return f"{self._namespace}:{key}"
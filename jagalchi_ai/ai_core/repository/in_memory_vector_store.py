@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
+import faiss
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.embeddings.fake import FakeEmbeddings
 from langchain_community.vectorstores import FAISS
 
@@ -12,13 +14,15 @@ from jagalchi_ai.ai_core.repository.vector_store import VectorStore
 class InMemoryVectorStore(VectorStore):
     """메모리 기반 벡터 스토어."""
 
-    def __init__(self, embedding_dim: int = 32) -> None:
+    def __init__(self, embedding_dim: int = 32, fp16_index: bool = False) -> None:
         """
         @param embedding_dim 임베딩 차원.
+        @param fp16_index True이면 FAISS 인덱스에 벡터를 float16으로 양자화해 저장(메모리/대역폭 절반).
         @returns None
         """
         self._items: Dict[str, VectorItem] = {}
         self._store: Optional[FAISS] = None
+        self._fp16_index = fp16_index
         # 외부 임베딩 대신 경량 임베딩 인터페이스를 사용한다.
         self._embeddings = FakeEmbeddings(size=embedding_dim)
 
@@ -80,7 +84,17 @@ class InMemoryVectorStore(VectorStore):
             metadatas.append(metadata)
             ids.append(item_id)
 
-        if self._store is None:
+        if self._store is None and self._fp16_index:
+            # QT_fp16 스칼라 양자화는 학습이 필요 없고, 검색 시 float32로 복원해 L2 거리를 계산한다.
+            index = faiss.IndexScalarQuantizer(len(text_embeddings[0][1]), faiss.ScalarQuantizer.QT_fp16)
+            self._store = FAISS(
+                embedding_function=self._embeddings,
+                index=index,
+                docstore=InMemoryDocstore(),
+                index_to_docstore_id={},
+            )
+            self._store.add_embeddings(text_embeddings=text_embeddings, metadatas=metadatas, ids=ids)
+        elif self._store is None:
             self._store = FAISS.from_embeddings(
                 text_embeddings=text_embeddings,
                 embedding=self._embeddings,
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from django.conf import settings
+
+from jagalchi_ai.ai_core.repository.snapshot import Snapshot
+from jagalchi_ai.ai_core.repository.snapshot_store import SnapshotStore
+
+try:
+    import lmdb
+
+    LMDB_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    lmdb = None
+    LMDB_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class LMDBSnapshotStore(SnapshotStore):
+    """
+    LMDB 파일(mmap B-tree)에 스냅샷을 저장해 재시작 후에도, 같은 호스트의 워커 간에도 공유하는 저장소.
+
+    모든 데이터는 LMDB에 있으므로 부모 클래스의 메모리 LRU(`_store`)는 만들지 않고
+    히트/미스 통계만 이어받습니다. `get_or_create`는 오버라이드한 get/put만 사용합니다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        map_size: int = 1 << 30,
+        ttl_seconds: Optional[int] = None,
+    ) -> None:
+        """
+        @param path LMDB 파일 경로(없으면 settings.LMDB_SNAPSHOT_PATH).
+        @param map_size 최대 데이터베이스 크기(바이트).
+        @param ttl_seconds 스냅샷 만료 시간(초, 없으면 만료 없음).
+        @returns None
+        """
+        if not LMDB_AVAILABLE:
+            raise ImportError("lmdb 패키지가 설치되지 않았습니다. 'pip install lmdb'로 설치하세요.")
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._path = Path(path) if path is not None else Path(settings.LMDB_SNAPSHOT_PATH)
+        self._ttl_seconds = ttl_seconds
+        self._env = lmdb.open(str(self._path), map_size=map_size, subdir=False, max_dbs=0)
+
+    def get(self, key: str) -> Optional[Snapshot]:
+        """
+        @param key 스냅샷 키.
+        @returns 캐시된 스냅샷 또는 None(없거나 만료).
+        """
+        encoded_key = key.encode("utf-8")
+        with self._env.begin() as txn:
+            raw = txn.get(encoded_key)
+        snapshot = None
+        if raw is not None:
+            record = _loads(raw)
+            expires_at = record.get("expires_at")
+            if expires_at is not None and expires_at <= time.time():
+                with self._env.begin(write=True) as txn:
+                    txn.delete(encoded_key)
+            else:
+                snapshot = _to_snapshot(record)
+        if snapshot:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return snapshot
+
+    def put(self, key: str, payload: Dict[str, Any], version: str, metadata: Optional[Dict[str, Any]] = None) -> Snapshot:
+        """
+        @param key 스냅샷 키.
+        @param payload 저장할 결과 JSON.
+        @param version 결과 버전.
+        @param metadata 부가 메타데이터.
+        @returns 저장된 Snapshot 객체.
+        """
+        snapshot = Snapshot(
+            key=key,
+            payload=payload,
+            version=version,
+            created_at=datetime.utcnow(),
+            metadata=metadata or {},
+        )
+        record = {
+            "key": snapshot.key,
+            "payload": snapshot.payload,
+            "version": snapshot.version,
+            "created_at": snapshot.created_at.isoformat(),
+            "metadata": snapshot.metadata,
+            "expires_at": time.time() + self._ttl_seconds if self._ttl_seconds is not None else None,
+        }
+        encoded = _dumps(record)
+        try:
+            self._write(key, encoded)
+        except lmdb.MapFullError:
+            # 맵이 가득 차면 만료된 스냅샷을 비운 뒤 한 번만 다시 시도하고,
+            # 그래도 공간이 없으면 저장을 건너뛰고 결과만 반환합니다.
+            self.evictions += self.purge_expired()
+            try:
+                self._write(key, encoded)
+            except lmdb.MapFullError:
+                logger.warning("LMDB 스냅샷 저장소가 가득 차 저장을 건너뜁니다: %s", self._path)
+        return snapshot
+
+    def purge_expired(self) -> int:
+        """
+        만료 시간이 지난 스냅샷을 모두 삭제합니다.
+
+        @returns 삭제한 스냅샷 개수.
+        """
+        now = time.time()
+        removed = 0
+        with self._env.begin(write=True) as txn:
+            cursor = txn.cursor()
+            for encoded_key, raw in list(cursor):
+                expires_at = _loads(raw).get("expires_at")
+                if expires_at is not None and expires_at <= now:
+                    txn.delete(encoded_key)
+                    removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """
+        저장된 스냅샷과 히트/미스 통계를 초기화합니다.
+
+        @returns None
+        """
+        with self._env.begin(write=True) as txn:
+            txn.drop(self._env.open_db(), delete=False)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def size(self) -> int:
+        """
+        @returns 저장된 스냅샷 개수(만료되었지만 아직 조회되지 않은 항목 포함).
+        """
+        return self._env.stat()["entries"]
+
+    def _write(self, key: str, encoded: bytes) -> None:
+        """
+        @param key 스냅샷 키.
+        @param encoded 직렬화된 레코드.
+        @returns None
+        """
+        with self._env.begin(write=True) as txn:
+            txn.put(key.encode("utf-8"), encoded, overwrite=True)
+
+    def close(self) -> None:
+        """
+        LMDB 환경을 닫습니다.
+
+        @returns None
+        """
+        self._env.close()
+
+
+def _dumps(record: Dict[str, Any]) -> bytes:
+    """
+    @param record 저장할 레코드.
+    @returns 직렬화된 JSON 바이트.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record)
+    return json.dumps(record, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """
+    @param raw 직렬화된 JSON 바이트.
+    @returns 복원된 레코드.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _to_snapshot(record: Dict[str, Any]) -> Snapshot:
+    """
+    @param record 저장된 레코드.
+    @returns Snapshot 객체.
+    """
+    return Snapshot(
+        key=record["key"],
+        payload=record["payload"],
+        version=record["version"],
+        created_at=datetime.fromisoformat(record["created_at"]),
+        metadata=record.get("metadata") or {},
+    )
@@ -1,23 +1,37 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import re
+from collections import deque
+from difflib import SequenceMatcher
+from typing import Any, Deque, Dict, List, Optional, Set
 
-from jagalchi_ai.ai_core.common.nlp.text_utils import cheap_embed, cosine_similarity
+from jagalchi_ai.ai_core.common.nlp.text_utils import cached_cheap_embed, cosine_similarity
 from jagalchi_ai.ai_core.domain.cache_entry import CacheEntry
 from jagalchi_ai.ai_core.repository.in_memory_vector_store import InMemoryVectorStore
 
 
+_NORMALIZE_RE = re.compile(r"[\W_]+")
+_SHINGLE_SIZE = 3
+_SHINGLE_PREFILTER = 0.8
+
+
 class SemanticCache:
     """검색 질의의 유사도를 이용해 답변을 재사용하는 캐시."""
 
-    def __init__(self, threshold: float = 0.9) -> None:
+    def __init__(self, threshold: float = 0.9, fuzzy_ratio: float = 0.95, recent_size: int = 64) -> None:
         """
         @param threshold 유사도 임계값.
+        @param fuzzy_ratio 정규화 질의 간 편집 유사도 임계값.
+        @param recent_size 편집 유사도를 확인할 최근 엔트리 수.
         @returns None
         """
-        self._store = InMemoryVectorStore()
+        # 임계값 재검증은 VectorItem의 원본 벡터로 하므로 인덱스는 float16으로 충분하다.
+        self._store = InMemoryVectorStore(fp16_index=True)
         self._entries: Dict[str, CacheEntry] = {}
         self._threshold = threshold
+        self._fuzzy_ratio = fuzzy_ratio
+        self._normalized: Dict[str, List[str]] = {}
+        self._recent: Deque[str] = deque(maxlen=recent_size)
 
     def get(self, query: str, metadata: Optional[Dict[str, Any]] = None) -> Optional[CacheEntry]:
         """
@@ -26,16 +40,18 @@ class SemanticCache:
         @returns 유사도가 임계값 이상이면 캐시 엔트리.
         """
         metadata = metadata or {}
-        vector = cheap_embed(query)
+        normalized = _normalize(query)
+        entry = self._lookup_normalized(normalized, metadata) or self._lookup_fuzzy(normalized, metadata)
+        if entry:
+            return entry
+        vector = cached_cheap_embed(query)
         items = self._store.query(vector, top_k=1, filters=metadata)
         if not items:
             return None
         item = items[0]
-        score = cosine_similarity(vector, item.vector)
-        if score < self._threshold:
+        if cosine_similarity(vector, item.vector) < self._threshold:
             return None
-        entry_id = item.item_id
-        return self._entries.get(entry_id)
+        return self._entries.get(item.item_id)
 
     def set(self, query: str, answer: str, metadata: Optional[Dict[str, Any]] = None) -> CacheEntry:
         """
@@ -47,7 +63,70 @@ class SemanticCache:
         metadata = metadata or {}
         entry_id = f"cache:{len(self._entries) + 1}"
         entry = CacheEntry(entry_id=entry_id, query=query, answer=answer, metadata=metadata)
-        vector = cheap_embed(query)
+        vector = cached_cheap_embed(query)
         self._entries[entry_id] = entry
         self._store.upsert(entry_id, vector=vector, metadata=metadata)
+        self._normalized.setdefault(_normalize(query), []).append(entry_id)
+        self._recent.append(entry_id)
         return entry
+
+    def _lookup_normalized(self, normalized: str, metadata: Dict[str, Any]) -> Optional[CacheEntry]:
+        """
+        @param normalized 정규화된 질의.
+        @param metadata 메타데이터 필터.
+        @returns 공백/구두점/대소문자만 다른 질의의 최신 캐시 엔트리.
+        """
+        for entry_id in reversed(self._normalized.get(normalized, [])):
+            entry = self._entries[entry_id]
+            if _matches(entry.metadata, metadata):
+                return entry
+        return None
+
+    def _lookup_fuzzy(self, normalized: str, metadata: Dict[str, Any]) -> Optional[CacheEntry]:
+        """
+        @param normalized 정규화된 질의.
+        @param metadata 메타데이터 필터.
+        @returns 최근 엔트리 중 편집 유사도가 임계값 이상인 캐시 엔트리.
+        """
+        if not normalized:
+            return None
+        shingles = _shingles(normalized)
+        for entry_id in reversed(self._recent):
+            entry = self._entries[entry_id]
+            if not _matches(entry.metadata, metadata):
+                continue
+            candidate = _normalize(entry.query)
+            candidate_shingles = _shingles(candidate)
+            overlap = len(shingles & candidate_shingles) / (len(shingles | candidate_shingles) or 1)
+            if overlap < _SHINGLE_PREFILTER:
+                continue
+            if SequenceMatcher(None, normalized, candidate).ratio() >= self._fuzzy_ratio:
+                return entry
+        return None
+
+
+def _normalize(text: str) -> str:
+    """
+    @param text 입력 질의.
+    @returns 소문자화 후 공백/구두점을 제거한 문자열.
+    """
+    return _NORMALIZE_RE.sub("", text.lower())
+
+
+def _shingles(text: str) -> Set[str]:
+    """
+    @param text 정규화된 문자열.
+    @returns 문자 3-gram 집합.
+    """
+    if len(text) <= _SHINGLE_SIZE:
+        return {text}
+    return {text[idx : idx + _SHINGLE_SIZE] for idx in range(len(text) - _SHINGLE_SIZE + 1)}
+
+
+def _matches(entry_metadata: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    """
+    @param entry_metadata 캐시 엔트리 메타데이터.
+    @param filters 메타데이터 필터.
+    @returns 모든 필터 값이 일치하면 True.
+    """
+    return all(entry_metadata.get(key) == value for key, value in filters.items())
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Callable, Dict, Optional
 
@@ -7,15 +8,20 @@ from jagalchi_ai.ai_core.repository.snapshot import Snapshot
 
 
 class SnapshotStore:
-    """스냅샷 캐시 저장소."""
+    """스냅샷 캐시 저장소 (최근 사용 순으로 max_entries개까지 보관)."""
 
-    def __init__(self) -> None:
+    DEFAULT_MAX_ENTRIES = 1024
+
+    def __init__(self, max_entries: Optional[int] = DEFAULT_MAX_ENTRIES) -> None:
         """
+        @param max_entries 보관할 최대 스냅샷 수(None이면 무제한).
         @returns None
         """
-        self._store: Dict[str, Snapshot] = {}
+        self._store: "OrderedDict[str, Snapshot]" = OrderedDict()
+        self._max_entries = max_entries
         self.hits = 0
         self.misses = 0
+        self.evictions = 0
 
     def get(self, key: str) -> Optional[Snapshot]:
         """
@@ -24,6 +30,7 @@ class SnapshotStore:
         """
         snapshot = self._store.get(key)
         if snapshot:
+            self._store.move_to_end(key)
             self.hits += 1
         else:
             self.misses += 1
@@ -45,6 +52,11 @@ class SnapshotStore:
             metadata=metadata or {},
         )
         self._store[key] = snapshot
+        self._store.move_to_end(key)
+        if self._max_entries is not None:
+            while len(self._store) > self._max_entries:
+                self._store.popitem(last=False)
+                self.evictions += 1
         return snapshot
 
     def get_or_create(
@@ -67,6 +79,17 @@ class SnapshotStore:
         payload = builder()
         return self.put(key, payload, version, metadata=metadata)
 
+    def clear(self) -> None:
+        """
+        저장된 스냅샷과 히트/미스/축출 통계를 초기화합니다.
+
+        @returns None
+        """
+        self._store.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
     def size(self) -> int:
         """
         @returns 저장된 스냅샷 개수.
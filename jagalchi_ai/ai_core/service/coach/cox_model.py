@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import numpy as np
 
 
 @dataclass
@@ -11,15 +13,19 @@ class CoxModel:
 
     baseline_hazard: float = 0.02
     coefficients: Dict[str, float] = None
+    _columns: Dict[str, int] = field(init=False, repr=False, compare=False)
+    _beta: np.ndarray = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """
         기본 계수를 초기화합니다.
 
-        @returns {None} coefficients가 없을 때 기본값을 설정합니다.
+        @returns {None} coefficients가 없을 때 기본값을 설정하고 계수 벡터를 준비합니다.
         """
         if self.coefficients is None:
             self.coefficients = {"motivation": -0.8, "ability": -0.6, "gap": 0.4}
+        self._columns = {key: idx for idx, key in enumerate(self.coefficients)}
+        self._beta = np.fromiter(self.coefficients.values(), dtype=float, count=len(self.coefficients))
 
     def hazard(self, features: Dict[str, float]) -> float:
         """
@@ -28,8 +34,22 @@ class CoxModel:
         @param {Dict[str, float]} features - 모델 입력 특성.
         @returns {float} 위험도 값.
         """
-        linear = sum(self.coefficients.get(key, 0.0) * value for key, value in features.items())
-        return self.baseline_hazard * math.exp(linear)
+        return float(self.hazard_batch([features])[0])
+
+    def hazard_batch(self, features: List[Dict[str, float]]) -> np.ndarray:
+        """
+        여러 사용자의 위험도를 한 번의 행렬 곱으로 계산합니다.
+
+        @param {List[Dict[str, float]]} features - 사용자별 모델 입력 특성 리스트.
+        @returns {np.ndarray} 사용자별 위험도 배열.
+        """
+        matrix = np.zeros((len(features), len(self._columns)))
+        for row, values in enumerate(features):
+            for key, value in values.items():
+                column = self._columns.get(key)
+                if column is not None:
+                    matrix[row, column] = value
+        return self.baseline_hazard * np.exp(matrix @ self._beta)
 
     def survival_probability(self, features: Dict[str, float], time: float) -> float:
         """
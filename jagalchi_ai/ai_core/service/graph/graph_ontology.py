@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+from threading import Lock
 from typing import Dict, List, Optional, Set
 
+from jagalchi_ai.ai_core.common.hashing import stable_hash_json
 from jagalchi_ai.ai_core.domain.graph_edge import GraphEdge
 from jagalchi_ai.ai_core.domain.roadmap import Roadmap
 from jagalchi_ai.ai_core.repository.mock_data import ROLE_REQUIREMENTS
 
 
+_ORDERED_EDGE_TYPES = {"hard", "soft"}
+_ONTOLOGY_CACHE_MAXSIZE = 8
+_ONTOLOGY_CACHE: Dict[str, "GraphOntology"] = {}
+_ONTOLOGY_CACHE_LOCK = Lock()
+
+
 class GraphOntology:
     """역할/스킬 그래프 온톨로지."""
 
@@ -19,6 +27,11 @@ class GraphOntology:
         self.nodes: Dict[str, str] = {}
         self.node_tags: Dict[str, List[str]] = {}
         self.edges: List[GraphEdge] = []
+        # hard/soft 엣지 그래프의 온라인 위상 순서(Pearce-Kelly)를 유지한다.
+        self._successors: Dict[str, List[str]] = {}
+        self._predecessors: Dict[str, List[str]] = {}
+        self._order: Dict[str, int] = {}
+        self._acyclic = True
 
     def add_node(self, node_id: str, node_type: str, tags: Optional[List[str]] = None) -> None:
         """
@@ -43,6 +56,8 @@ class GraphOntology:
             if self._introduces_cycle(edge.source, edge.target):
                 raise ValueError("Cycle detected in skill graph")
         self.edges.append(edge)
+        if edge.edge_type in _ORDERED_EDGE_TYPES:
+            self._track_edge(edge.source, edge.target)
 
     def extract_subgraph(self, target_role: str) -> Set[str]:
         """
@@ -109,19 +124,72 @@ class GraphOntology:
         @param {str} target - 엣지 대상 노드.
         @returns {bool} 사이클 발생 여부.
         """
-        visited = set()
-        stack = [target]
+        if source == target:
+            return True
+        if source not in self._order or target not in self._order:
+            return False
+        if not self._acyclic:
+            return source in self._reachable(target, None)
+        upper = self._order[source]
+        if self._order[target] > upper:
+            return False
+        return source in self._reachable(target, upper)
+
+    def _track_edge(self, source: str, target: str) -> None:
+        """
+        hard/soft 엣지를 인접 리스트와 위상 순서에 반영합니다.
+
+        @param {str} source - 엣지 시작 노드.
+        @param {str} target - 엣지 대상 노드.
+        @returns {None} 위상 순서가 깨진 구간만 재배치합니다.
+        """
+        for node in (source, target):
+            if node not in self._order:
+                self._order[node] = len(self._order)
+                self._successors[node] = []
+                self._predecessors[node] = []
+        self._successors[source].append(target)
+        self._predecessors[target].append(source)
+        if not self._acyclic:
+            return
+        lower, upper = self._order[target], self._order[source]
+        if lower > upper:
+            return
+        forward = self._reachable(target, upper)
+        if source in forward:
+            # 스킬 외 노드 사이 엣지는 검사 없이 허용되므로 순서 유지를 포기하고 전체 탐색으로 전환한다.
+            self._acyclic = False
+            return
+        backward = self._reachable(source, lower, reverse=True)
+        affected = sorted(backward, key=self._order.__getitem__) + sorted(forward, key=self._order.__getitem__)
+        slots = sorted(self._order[node] for node in affected)
+        for node, slot in zip(affected, slots):
+            self._order[node] = slot
+
+    def _reachable(self, start: str, bound: Optional[int], reverse: bool = False) -> Set[str]:
+        """
+        위상 순서 경계 안에서 도달 가능한 노드를 탐색합니다.
+
+        @param {str} start - 탐색 시작 노드.
+        @param {Optional[int]} bound - 순방향은 상한, 역방향은 하한 순서값 (None이면 제한 없음).
+        @param {bool} reverse - 선행 노드 방향 탐색 여부.
+        @returns {Set[str]} 도달 가능한 노드 집합.
+        """
+        adjacency = self._predecessors if reverse else self._successors
+        visited = {start}
+        stack = [start]
         while stack:
             node = stack.pop()
-            if node == source:
-                return True
-            if node in visited:
-                continue
-            visited.add(node)
-            for edge in self.edges:
-                if edge.edge_type in {"hard", "soft"} and edge.source == node:
-                    stack.append(edge.target)
-        return False
+            for neighbor in adjacency.get(node, []):
+                if neighbor in visited:
+                    continue
+                if bound is not None:
+                    rank = self._order[neighbor]
+                    if (rank < bound) if reverse else (rank > bound):
+                        continue
+                visited.add(neighbor)
+                stack.append(neighbor)
+        return visited
 
 
 def build_ontology(roadmaps: Dict[str, Roadmap]) -> GraphOntology:
@@ -145,6 +213,39 @@ def build_ontology(roadmaps: Dict[str, Roadmap]) -> GraphOntology:
     return ontology
 
 
+def cached_ontology(roadmaps: Dict[str, Roadmap]) -> GraphOntology:
+    """
+    로드맵 구조가 같으면 이미 구성한 온톨로지를 재사용합니다.
+
+    반환된 온톨로지는 호출자 사이에서 공유되므로 읽기 전용으로 사용해야 합니다.
+
+    @param {Dict[str, Roadmap]} roadmaps - 로드맵 데이터.
+    @returns {GraphOntology} 캐시되었거나 새로 구성한 온톨로지 객체.
+    """
+    key = stable_hash_json(
+        {
+            roadmap_id: {
+                "nodes": [[node.node_id, node.tags] for node in roadmap.nodes],
+                "edges": roadmap.edges,
+            }
+            for roadmap_id, roadmap in roadmaps.items()
+        }
+    )
+    with _ONTOLOGY_CACHE_LOCK:
+        ontology = _ONTOLOGY_CACHE.get(key)
+    if ontology is not None:
+        return ontology
+    built = build_ontology(roadmaps)
+    with _ONTOLOGY_CACHE_LOCK:
+        # 동시에 미스가 난 다른 요청이 먼저 넣었다면 그 인스턴스를 공유합니다.
+        ontology = _ONTOLOGY_CACHE.get(key)
+        if ontology is None:
+            while len(_ONTOLOGY_CACHE) >= _ONTOLOGY_CACHE_MAXSIZE:
+                _ONTOLOGY_CACHE.pop(next(iter(_ONTOLOGY_CACHE)))
+            _ONTOLOGY_CACHE[key] = ontology = built
+    return ontology
+
+
 def _preference_score(tags: List[str], preferred: List[str]) -> float:
     """
     태그 선호도를 점수로 환산합니다.
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from typing import Dict, List
 
-from jagalchi_ai.ai_core.common.nlp.text_utils import cheap_embed
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from jagalchi_ai.ai_core.common.nlp.text_utils import cached_cheap_embed_batch
 
 
 class GraphSAGE:
@@ -21,27 +24,25 @@ class GraphSAGE:
         """
         노드 텍스트와 그래프 구조를 기반으로 임베딩을 계산합니다.
 
+        이웃 평균 집계는 행 정규화된 희소 인접 행렬 곱으로 한 번에 수행합니다.
+
         @param {Dict[str, str]} node_text - 노드별 텍스트.
         @param {Dict[str, List[str]]} adjacency - 인접 리스트.
         @param {int} iterations - 메시지 패싱 반복 횟수.
         @returns {Dict[str, List[float]]} 노드별 임베딩.
         """
-        embeddings = {node_id: cheap_embed(text, dim=self._dim) for node_id, text in node_text.items()}
+        node_ids = list(node_text)
+        if not node_ids:
+            return {}
+        features = np.asarray(cached_cheap_embed_batch(list(node_text.values()), dim=self._dim), dtype=np.float32)
+        mean_adjacency, has_neighbors = _mean_adjacency(node_ids, adjacency)
         for _ in range(iterations):
-            updated = {}
-            for node_id, vector in embeddings.items():
-                neighbors = adjacency.get(node_id, [])
-                if not neighbors:
-                    updated[node_id] = vector
-                    continue
-                agg = [0.0 for _ in range(self._dim)]
-                for neighbor in neighbors:
-                    neighbor_vec = embeddings.get(neighbor, vector)
-                    agg = [a + b for a, b in zip(agg, neighbor_vec)]
-                agg = [value / max(len(neighbors), 1) for value in agg]
-                updated[node_id] = _normalize([a + b for a, b in zip(vector, agg)])
-            embeddings = updated
-        return embeddings
+            combined = features[has_neighbors] + (mean_adjacency @ features)[has_neighbors]
+            norms = np.linalg.norm(combined, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            features = features.copy()
+            features[has_neighbors] = combined / norms
+        return {node_id: row.tolist() for node_id, row in zip(node_ids, features)}
 
     def predict_next(self, node_id: str, embeddings: Dict[str, List[float]], adjacency: Dict[str, List[str]], top_k: int = 3) -> List[str]:
         """
@@ -54,35 +55,40 @@ class GraphSAGE:
         @returns {List[str]} 추천 노드 ID 목록.
         """
         target = embeddings.get(node_id)
-        if not target:
+        neighbors = adjacency.get(node_id, [])
+        if not target or not neighbors:
             return []
-        candidates = []
-        for neighbor in adjacency.get(node_id, []):
-            score = _dot(target, embeddings.get(neighbor, target))
-            candidates.append((score, neighbor))
-        candidates.sort(key=lambda pair: pair[0], reverse=True)
-        return [node for _, node in candidates[:top_k]]
-
+        candidates = np.asarray([embeddings.get(neighbor, target) for neighbor in neighbors], dtype=np.float32)
+        scores = candidates @ np.asarray(target, dtype=np.float32)
+        # float32 연산 오차 수준의 차이는 동점으로 보고 입력 순서를 유지한다.
+        ranked = np.argsort(-np.round(scores, 6), kind="stable")[:top_k]
+        return [neighbors[idx] for idx in ranked]
 
-def _normalize(vector: List[float]) -> List[float]:
-    """
-    벡터를 L2 정규화합니다.
 
-    @param {List[float]} vector - 입력 벡터.
-    @returns {List[float]} 정규화된 벡터.
+def _mean_adjacency(node_ids: List[str], adjacency: Dict[str, List[str]]) -> tuple[csr_matrix, np.ndarray]:
     """
-    norm = sum(v * v for v in vector) ** 0.5
-    if norm == 0:
-        return vector
-    return [v / norm for v in vector]
-
+    이웃 평균 집계를 위한 행 정규화 희소 인접 행렬을 구성합니다.
 
-def _dot(a: List[float], b: List[float]) -> float:
-    """
-    두 벡터의 내적을 계산합니다.
+    임베딩이 없는 이웃은 기존 구현과 동일하게 자기 자신의 벡터로 대체합니다.
 
-    @param {List[float]} a - 벡터 A.
-    @param {List[float]} b - 벡터 B.
-    @returns {float} 내적 결과.
+    @param {List[str]} node_ids - 행렬 순서의 노드 ID 목록.
+    @param {Dict[str, List[str]]} adjacency - 인접 리스트.
+    @returns {tuple[csr_matrix, np.ndarray]} 평균 인접 행렬과 이웃 보유 여부 마스크.
     """
-    return sum(x * y for x, y in zip(a, b))
+    index = {node_id: idx for idx, node_id in enumerate(node_ids)}
+    rows: List[int] = []
+    cols: List[int] = []
+    data: List[float] = []
+    has_neighbors = np.zeros(len(node_ids), dtype=bool)
+    for row, node_id in enumerate(node_ids):
+        neighbors = adjacency.get(node_id, [])
+        if not neighbors:
+            continue
+        has_neighbors[row] = True
+        weight = 1.0 / len(neighbors)
+        for neighbor in neighbors:
+            rows.append(row)
+            cols.append(index.get(neighbor, row))
+            data.append(weight)
+    size = len(node_ids)
+    return csr_matrix((data, (rows, cols)), shape=(size, size), dtype=np.float32), has_neighbors
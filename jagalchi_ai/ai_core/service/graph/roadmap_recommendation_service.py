@@ -6,7 +6,7 @@ from typing import Dict, List, Optional
 from jagalchi_ai.ai_core.domain.graph_edge import GraphEdge
 from jagalchi_ai.ai_core.domain.roadmap import Roadmap
 from jagalchi_ai.ai_core.repository.mock_data import USER_MASTERED_SKILLS, USER_PREFERENCES
-from jagalchi_ai.ai_core.service.graph.graph_ontology import build_ontology
+from jagalchi_ai.ai_core.service.graph.graph_ontology import cached_ontology
 from jagalchi_ai.ai_core.service.graph.graph_sage import GraphSAGE
 
 
@@ -21,7 +21,7 @@ class RoadmapRecommendationService:
         @returns {None} 온톨로지와 GNN을 구성합니다.
         """
         self._roadmaps = roadmaps
-        self._ontology = build_ontology(roadmaps)
+        self._ontology = cached_ontology(roadmaps)
         self._gnn = GraphSAGE()
 
     def recommend(
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import calendar
+import time
 from datetime import datetime
-from math import exp
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from jagalchi_ai.ai_core.domain.learning_state import LearningState
 from jagalchi_ai.ai_core.domain.roadmap import Roadmap
 
 
+_SECONDS_PER_DAY = 86_400
+
+
 class ProgressTrackingService:
     """학습 진행 상태를 관리하는 서비스."""
 
@@ -51,7 +57,7 @@ class ProgressTrackingService:
         state = self._state[user_id][node_id]
         state.status = "COMPLETED"
         state.proficiency = min(1.0, max(0.0, quiz_score / 100))
-        state.last_reviewed = datetime.utcnow()
+        state.last_reviewed = int(time.time())
 
     def unlock_children(self, user_id: str, roadmap: Roadmap, completed_node_id: str) -> List[str]:
         """
@@ -82,16 +88,24 @@ class ProgressTrackingService:
         @param {Optional[datetime]} now - 기준 시간 (없으면 현재).
         @returns {List[str]} 복습 필요 노드 ID 목록.
         """
-        now = now or datetime.utcnow()
+        now_epoch = to_epoch(now) if now else int(time.time())
+        reviewed = [
+            (node_id, state) for node_id, state in self._state.get(user_id, {}).items() if state.last_reviewed
+        ]
+        if not reviewed:
+            return []
+        count = len(reviewed)
+        last_epoch = np.fromiter((state.last_reviewed for _, state in reviewed), dtype=np.int64, count=count)
+        proficiency = np.fromiter((state.proficiency for _, state in reviewed), dtype=float, count=count)
+        decay = np.fromiter((state.decay_factor for _, state in reviewed), dtype=float, count=count)
+        days = (now_epoch - last_epoch) // _SECONDS_PER_DAY
+        elapsed = days > 0
+        decayed = np.maximum(0.0, proficiency * np.exp(-decay * days))
+
         needs_review = []
-        for node_id, state in self._state.get(user_id, {}).items():
-            if not state.last_reviewed:
-                continue
-            days = (now - state.last_reviewed).days
-            if days <= 0:
-                continue
-            decayed = state.proficiency * exp(-state.decay_factor * days)
-            state.proficiency = max(0.0, decayed)
+        for idx in np.flatnonzero(elapsed):
+            node_id, state = reviewed[idx]
+            state.proficiency = float(decayed[idx])
             if state.proficiency < 0.4 and state.status == "COMPLETED":
                 state.status = "NEEDS_REVIEW"
                 needs_review.append(node_id)
@@ -120,6 +134,16 @@ class ProgressTrackingService:
         return self._state[user_id][node_id]
 
 
+def to_epoch(value: datetime) -> int:
+    """
+    datetime 값을 UTC epoch 초로 변환합니다.
+
+    @param {datetime} value - 변환할 시각 (naive 값은 UTC로 간주).
+    @returns {int} UTC epoch 초.
+    """
+    return calendar.timegm(value.utctimetuple())
+
+
 def _build_prereq_map(edges: List[tuple[str, str]]) -> Dict[str, List[str]]:
     """
     엣지 목록에서 선수 학습 맵을 구성합니다.
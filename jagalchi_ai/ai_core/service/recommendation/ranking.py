@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Dict, List
 
+import numpy as np
+
 
 @dataclass
 class RankingFeature:
@@ -22,6 +24,8 @@ DEFAULT_WEIGHTS = {
     "difficulty_match": 0.1,
 }
 
+FEATURE_ORDER = tuple(DEFAULT_WEIGHTS)
+
 
 def score_candidate(features: RankingFeature, weights: Dict[str, float] | None = None) -> float:
     """
@@ -40,6 +44,20 @@ def score_candidate(features: RankingFeature, weights: Dict[str, float] | None =
     )
 
 
+def score_candidates(features: List[RankingFeature], weights: Dict[str, float] | None = None) -> np.ndarray:
+    """
+    @param features 후보별 랭킹 피처 리스트.
+    @param weights 피처 가중치 맵.
+    @returns 피처 행렬과 가중치 벡터의 곱으로 계산한 후보별 점수 배열.
+    """
+    weights = weights or DEFAULT_WEIGHTS
+    if not features:
+        return np.zeros(0)
+    matrix = np.array([[getattr(feature, name) for name in FEATURE_ORDER] for feature in features], dtype=float)
+    vector = np.array([weights[name] for name in FEATURE_ORDER])
+    return matrix @ vector
+
+
 def normalize_ranked(candidates: List[dict]) -> List[dict]:
     """
     @param candidates 점수 포함 후보 리스트.
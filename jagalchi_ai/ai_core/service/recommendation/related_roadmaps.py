@@ -4,9 +4,12 @@ from datetime import datetime
 from math import log
 from typing import Dict, List, Optional
 
+import numpy as np
+from scipy.sparse import csr_matrix
+
 from jagalchi_ai.ai_core.domain.roadmap import Roadmap
 from jagalchi_ai.ai_core.repository.mock_data import CO_COMPLETE, CO_FOLLOW, CREATOR_TRUST, POPULARITY, ROADMAPS, SIMILAR_USER
-from jagalchi_ai.ai_core.service.recommendation.ranking import RankingFeature, normalize_ranked, score_candidate
+from jagalchi_ai.ai_core.service.recommendation.ranking import RankingFeature, normalize_ranked, score_candidates
 
 
 class RelatedRoadmapsService:
@@ -18,6 +21,9 @@ class RelatedRoadmapsService:
         @returns None
         """
         self._roadmaps = roadmaps or ROADMAPS
+        self._ids = list(self._roadmaps)
+        self._index = {roadmap_id: idx for idx, roadmap_id in enumerate(self._ids)}
+        self._tag_matrix = _build_tag_matrix([self._roadmaps[roadmap_id].tags for roadmap_id in self._ids])
 
     def generate_snapshot(self, roadmap_id: str) -> Dict[str, object]:
         """
@@ -25,8 +31,10 @@ class RelatedRoadmapsService:
         @returns 연관 로드맵 추천 스냅샷 JSON.
         """
         roadmap = self._roadmaps[roadmap_id]
-        candidates = self._generate_candidates(roadmap)
-        ranked = self._rank_candidates(roadmap, candidates)
+        row = self._tag_matrix[self._index[roadmap_id]].toarray().ravel()
+        overlaps = self._tag_matrix @ row
+        candidates = self._generate_candidates(roadmap, overlaps)
+        ranked = self._rank_candidates(roadmap, candidates, overlaps)
 
         payload = {
             "roadmap_id": roadmap_id,
@@ -40,9 +48,10 @@ class RelatedRoadmapsService:
         }
         return payload
 
-    def _generate_candidates(self, roadmap: Roadmap) -> Dict[str, Dict[str, object]]:
+    def _generate_candidates(self, roadmap: Roadmap, overlaps: np.ndarray) -> Dict[str, Dict[str, object]]:
         """
         @param roadmap 기준 로드맵 객체.
+        @param overlaps 로드맵별 기준 로드맵과의 공통 태그 수 배열.
         @returns 후보 로드맵과 사유를 담은 맵.
         """
         candidates: Dict[str, Dict[str, object]] = {}
@@ -63,58 +72,88 @@ class RelatedRoadmapsService:
                 {"type": "social", "value": value}
             )
 
-        for related_id, related in self._roadmaps.items():
+        for idx in np.flatnonzero(overlaps):
+            related_id = self._ids[idx]
             if related_id == source_id:
                 continue
-            overlap = len(set(roadmap.tags) & set(related.tags))
-            if overlap > 0:
-                candidates.setdefault(related_id, {"reasons": []})["reasons"].append(
-                    {"type": "tag_overlap", "value": overlap}
-                )
+            candidates.setdefault(related_id, {"reasons": []})["reasons"].append(
+                {"type": "tag_overlap", "value": int(overlaps[idx])}
+            )
 
         return candidates
 
-    def _rank_candidates(self, roadmap: Roadmap, candidates: Dict[str, Dict[str, object]]) -> List[Dict[str, object]]:
+    def _rank_candidates(
+        self,
+        roadmap: Roadmap,
+        candidates: Dict[str, Dict[str, object]],
+        overlaps: np.ndarray,
+    ) -> List[Dict[str, object]]:
         """
         @param roadmap 기준 로드맵 객체.
         @param candidates 후보 로드맵 맵.
+        @param overlaps 로드맵별 기준 로드맵과의 공통 태그 수 배열.
         @returns 점수 순으로 정렬된 후보 리스트.
         """
-        ranked: List[Dict[str, object]] = []
-        for related_id, payload in candidates.items():
+        now = datetime.utcnow()
+        completion = CO_COMPLETE.get(roadmap.roadmap_id, {})
+        related_ids: List[str] = []
+        features: List[RankingFeature] = []
+        for related_id in candidates:
             related = self._roadmaps.get(related_id)
             if not related:
                 continue
-            overlap = len(set(roadmap.tags) & set(related.tags))
-            features = RankingFeature(
-                tag_overlap=overlap,
-                creator_trust_score=CREATOR_TRUST.get(related.creator_id, 0.5),
-                completion_rate=CO_COMPLETE.get(roadmap.roadmap_id, {}).get(related_id, 0.0),
-                freshness=_freshness_score(related.updated_at),
-                popularity=_popularity_score(POPULARITY.get(related_id, 0)),
-                difficulty_match=1 - abs(roadmap.difficulty - related.difficulty),
-            )
-            score = score_candidate(features)
-            ranked.append(
-                {
-                    "related_roadmap_id": related_id,
-                    "score": score,
-                    "reasons": payload["reasons"],
-                }
+            related_ids.append(related_id)
+            features.append(
+                RankingFeature(
+                    tag_overlap=int(overlaps[self._index[related_id]]),
+                    creator_trust_score=CREATOR_TRUST.get(related.creator_id, 0.5),
+                    completion_rate=completion.get(related_id, 0.0),
+                    freshness=_freshness_score(related.updated_at, now),
+                    popularity=_popularity_score(POPULARITY.get(related_id, 0)),
+                    difficulty_match=1 - abs(roadmap.difficulty - related.difficulty),
+                )
             )
 
-        ranked.sort(key=lambda item: (-item["score"], item["related_roadmap_id"]))
+        scores = score_candidates(features)
+        # 행렬 곱의 부동소수점 오차로 동점 순서가 흔들리지 않도록 반올림한 점수로 정렬한다.
+        order = sorted(range(len(related_ids)), key=lambda idx: (-round(scores[idx], 12), related_ids[idx]))
+        ranked: List[Dict[str, object]] = [
+            {
+                "related_roadmap_id": related_ids[idx],
+                "score": float(scores[idx]),
+                "reasons": candidates[related_ids[idx]]["reasons"],
+            }
+            for idx in order
+        ]
         return normalize_ranked(ranked)
 
 
-def _freshness_score(updated_at) -> float:
+def _build_tag_matrix(tag_lists: List[List[str]]) -> csr_matrix:
+    """
+    @param tag_lists 로드맵별 태그 리스트.
+    @returns 로드맵 x 태그 0/1 희소 행렬(행렬 곱으로 공통 태그 수를 계산).
+    """
+    vocabulary: Dict[str, int] = {}
+    rows: List[int] = []
+    cols: List[int] = []
+    for row, tags in enumerate(tag_lists):
+        # 같은 태그가 중복되어도 1로 셉니다(희소 행렬 생성 시 중복 좌표는 합산되므로).
+        for tag in dict.fromkeys(tags):
+            rows.append(row)
+            cols.append(vocabulary.setdefault(tag, len(vocabulary)))
+    data = np.ones(len(rows), dtype=np.int64)
+    return csr_matrix((data, (rows, cols)), shape=(len(tag_lists), len(vocabulary)))
+
+
+def _freshness_score(updated_at, now: Optional[datetime] = None) -> float:
     """
     @param updated_at 마지막 업데이트 시각.
+    @param now 기준 시각(없으면 현재 UTC 시각).
     @returns 최신성 점수.
     """
     if not updated_at:
         return 0.5
-    delta = (datetime.utcnow() - updated_at).days
+    delta = ((now or datetime.utcnow()) - updated_at).days
     return 1 / (1 + delta)
 
 
@@ -1,6 +1,9 @@
 import re
+from collections import OrderedDict
+from threading import Lock
 from typing import Dict, List
 
+from jagalchi_ai.ai_core.common.hashing import stable_hash_fields
 from jagalchi_ai.ai_core.domain.learning_record import LearningRecord
 from jagalchi_ai.ai_core.domain.link_meta import LinkMeta
 
@@ -12,6 +15,10 @@ _NEXT_KEYWORDS = ["다음", "next", "추가", "계획"]
 
 _ERROR_PATTERN = re.compile(r"(error|exception|traceback|fail|failed|500|404)", re.IGNORECASE)
 
+_SCORE_CACHE_MAXSIZE = 4096
+_SCORE_CACHE: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+_SCORE_CACHE_LOCK = Lock()
+
 
 def evidence_level(record: LearningRecord) -> int:
     """
@@ -86,6 +93,25 @@ def score_record(record: LearningRecord) -> Dict[str, int]:
     @param record 학습 기록 객체.
     @returns 루브릭 점수 맵.
     """
+    key = _record_key(record)
+    with _SCORE_CACHE_LOCK:
+        cached = _SCORE_CACHE.get(key)
+        if cached is not None:
+            _SCORE_CACHE.move_to_end(key)
+            return dict(cached)
+    scores = _compute_scores(record)
+    with _SCORE_CACHE_LOCK:
+        _SCORE_CACHE[key] = dict(scores)
+        while len(_SCORE_CACHE) > _SCORE_CACHE_MAXSIZE:
+            _SCORE_CACHE.popitem(last=False)
+    return scores
+
+
+def _compute_scores(record: LearningRecord) -> Dict[str, int]:
+    """
+    @param record 학습 기록 객체.
+    @returns 캐시를 거치지 않고 계산한 루브릭 점수 맵.
+    """
     scores = {
         "evidence_level": evidence_level(record),
         "structure_score": structure_score(record),
@@ -96,6 +122,18 @@ def score_record(record: LearningRecord) -> Dict[str, int]:
     return scores
 
 
+def _record_key(record: LearningRecord) -> str:
+    """
+    @param record 학습 기록 객체.
+    @returns 점수에 영향을 주는 메모/링크 필드 기준 콘텐츠 해시.
+    """
+    fields = [(record.memo,)]
+    fields.extend(
+        (link.url, "1" if link.is_public else "0", str(link.status_code)) for link in record.links
+    )
+    return stable_hash_fields(fields)
+
+
 def _contains_any(text: str, keywords: List[str]) -> bool:
     """
     @param text 검색 대상 문자열.
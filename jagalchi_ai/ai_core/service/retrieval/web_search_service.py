@@ -25,12 +25,16 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Union
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from jagalchi_ai.ai_core.client import ExaSearchClient, ExaSearchOptions, TavilySearchClient
 from jagalchi_ai.ai_core.common.hashing import stable_hash_json
@@ -41,6 +45,9 @@ from jagalchi_ai.ai_core.repository.snapshot_store import SnapshotStore
 # =============================================================================
 logger = logging.getLogger(__name__)
 
+# Tavily/Exa 호출은 네트워크 대기가 대부분이므로 공유 스레드 풀에서 동시에 수행합니다.
+_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="web-search")
+
 
 # =============================================================================
 # 열거형 정의
@@ -310,9 +317,9 @@ class WebSearchService:
             logger.warning("사용 가능한 검색 엔진이 없습니다")
             return []
 
-        # 캐시 키 생성
+        # 캐시 키 생성 (대소문자/공백만 다른 쿼리는 같은 스냅샷을 사용)
         cache_key = stable_hash_json({
-            "query": query,
+            "query": _normalize_query(query),
             "top_k": top_k,
             "engines": engines,
             "recency_days": recency_days,
@@ -320,13 +327,8 @@ class WebSearchService:
 
         # 캐시 사용 시 스냅샷 조회
         if use_cache:
-            snapshot = self._snapshot_store.get_or_create(
-                cache_key,
-                version=self.CACHE_VERSION,
-                builder=lambda: self._fetch(query, top_k, engines, recency_days),
-                metadata={"query": query, "engines": engines, "recency_days": recency_days},
-            )
-            return snapshot.payload.get("results", [])
+            payload = self._cached_fetch(cache_key, query, top_k, engines, recency_days)
+            return payload.get("results", [])
         else:
             # 캐시 미사용 시 직접 검색
             payload = self._fetch(query, top_k, engines, recency_days)
@@ -352,20 +354,14 @@ class WebSearchService:
         """
         engines = self._get_engines_to_use(engine)
         cache_key = stable_hash_json({
-            "query": query,
+            "query": _normalize_query(query),
             "top_k": top_k,
             "engines": engines,
             "recency_days": recency_days,
             "metadata": True,
         })
         if use_cache:
-            snapshot = self._snapshot_store.get_or_create(
-                cache_key,
-                version=self.CACHE_VERSION,
-                builder=lambda: self._fetch(query, top_k, engines, recency_days),
-                metadata={"query": query, "engines": engines, "recency_days": recency_days},
-            )
-            return snapshot.payload
+            return self._cached_fetch(cache_key, query, top_k, engines, recency_days)
         return self._fetch(query, top_k, engines, recency_days)
 
     def get_search_context(
@@ -430,6 +426,40 @@ class WebSearchService:
         else:  # ALL
             return self.available_engines
 
+    def _cached_fetch(
+        self,
+        cache_key: str,
+        query: str,
+        top_k: int,
+        engines: List[str],
+        recency_days: Optional[int],
+    ) -> Dict[str, Any]:
+        """
+        스냅샷이 있으면 재사용하고, 없으면 검색한 뒤 성공한 결과만 스냅샷으로 저장합니다.
+
+        스냅샷은 워커 간에 공유되므로, 엔진 오류나 빈 결과를 저장하면
+        일시적인 장애가 만료 시간 동안 모든 요청에 그대로 노출됩니다.
+
+        @param cache_key 스냅샷 키.
+        @param query 검색 쿼리.
+        @param top_k 최대 결과 수.
+        @param engines 사용할 엔진 목록.
+        @param recency_days 최신 자료 필터 기간(일).
+        @returns 검색 결과 페이로드.
+        """
+        snapshot = self._snapshot_store.get(cache_key)
+        if snapshot:
+            return snapshot.payload
+        payload = self._fetch(query, top_k, engines, recency_days)
+        if payload.get("results") and not payload.get("failed_engines"):
+            self._snapshot_store.put(
+                cache_key,
+                payload,
+                self.CACHE_VERSION,
+                metadata={"query": query, "engines": engines, "recency_days": recency_days},
+            )
+        return payload
+
     def _fetch(
         self,
         query: str,
@@ -444,7 +474,7 @@ class WebSearchService:
         @param top_k 최대 결과 수.
         @param engines 사용할 엔진 목록.
         @param recency_days 최신 자료 필터 기간(일).
-        @returns 검색 결과 페이로드.
+        @returns 검색 결과 페이로드(실패한 엔진은 failed_engines에 기록).
         """
         if not engines:
             return self._create_empty_response(query)
@@ -455,10 +485,29 @@ class WebSearchService:
         if recency_days is not None and recency_days > 0:
             start_date = (today_date - timedelta(days=recency_days)).isoformat()
         results: List[Dict[str, Any]] = []
+        failed_engines: List[str] = []
+
+        use_tavily = "tavily" in engines and self._tavily.available
+        use_exa = "exa" in engines and self._exa.available()
+
+        # 두 엔진을 모두 쓰는 경우 Tavily는 공유 스레드 풀에서, Exa는 현재 스레드에서 동시에 검색
+        tavily_future = None
+        if use_tavily and use_exa:
+            tavily_future = _SEARCH_EXECUTOR.submit(self._search_with_tavily, query, top_k, today, recency_days)
+        exa_results = self._search_with_exa(query, top_k, today, start_date) if use_exa else []
+        if exa_results is None:
+            failed_engines.append("exa")
+            exa_results = []
 
         # Tavily 검색
-        if "tavily" in engines and self._tavily.available:
-            tavily_results = self._search_with_tavily(query, top_k, today, recency_days)
+        if use_tavily:
+            if tavily_future is not None:
+                tavily_results = tavily_future.result()
+            else:
+                tavily_results = self._search_with_tavily(query, top_k, today, recency_days)
+            if tavily_results is None:
+                failed_engines.append("tavily")
+                tavily_results = []
             results.extend(tavily_results)
             logger.debug(
                 "Tavily 검색 완료",
@@ -466,22 +515,22 @@ class WebSearchService:
             )
 
         # Exa 검색
-        if "exa" in engines and self._exa.available():
-            exa_results = self._search_with_exa(query, top_k, today, start_date)
+        if use_exa:
             results.extend(exa_results)
             logger.debug(
                 "Exa 검색 완료",
                 extra={"query": query[:30], "count": len(exa_results)},
             )
 
-        # 중복 제거 및 정렬
-        deduped = _dedupe_results(results)
+        # 중복 제거 및 상위 top_k 선택
+        deduped = _dedupe_results(results, top_k=top_k)
 
         return {
             "query": query,
-            "results": deduped[:top_k],
+            "results": deduped,
             "generated_at": datetime.utcnow().isoformat(),
             "engines_used": engines,
+            "failed_engines": failed_engines,
             "total_results_before_dedup": len(results),
         }
 
@@ -491,7 +540,7 @@ class WebSearchService:
         top_k: int,
         today: str,
         recency_days: Optional[int],
-    ) -> List[Dict[str, Any]]:
+    ) -> Optional[List[Dict[str, Any]]]:
         """
         Tavily 검색을 수행합니다.
 
@@ -499,7 +548,7 @@ class WebSearchService:
         @param top_k 최대 결과 수.
         @param today 오늘 날짜 문자열.
         @param recency_days 최신 자료 필터 기간(일).
-        @returns Tavily 검색 결과 리스트.
+        @returns Tavily 검색 결과 리스트(검색 실패 시 None).
         """
         results = []
         try:
@@ -521,6 +570,7 @@ class WebSearchService:
                 extra={"query": query[:30], "error": str(e)},
                 exc_info=True,
             )
+            return None
         return results
 
     def _search_with_exa(
@@ -529,7 +579,7 @@ class WebSearchService:
         top_k: int,
         today: str,
         start_date: Optional[str],
-    ) -> List[Dict[str, Any]]:
+    ) -> Optional[List[Dict[str, Any]]]:
         """
         Exa 검색을 수행합니다.
 
@@ -537,7 +587,7 @@ class WebSearchService:
         @param top_k 최대 결과 수.
         @param today 오늘 날짜 문자열.
         @param start_date 최신 자료 시작 날짜(ISO).
-        @returns Exa 검색 결과 리스트.
+        @returns Exa 검색 결과 리스트(검색 실패 시 None).
         """
         results = []
         try:
@@ -567,6 +617,7 @@ class WebSearchService:
                 extra={"query": query[:30], "error": str(e)},
                 exc_info=True,
             )
+            return None
         return results
 
     def _create_empty_response(self, query: str) -> Dict[str, Any]:
@@ -649,21 +700,37 @@ class WebSearchService:
 # 유틸리티 함수
 # =============================================================================
 
-def _dedupe_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+@lru_cache(maxsize=4096)
+def _normalize_query(query: str) -> str:
+    """
+    캐시 키용으로 쿼리를 정규화합니다.
+
+    앞뒤/연속 공백을 정리하고 소문자로 변환합니다. 같은 쿼리가 반복되는 경우가
+    많으므로 결과를 메모이즈합니다.
+
+    @param query 검색 쿼리.
+    @returns 정규화된 쿼리 문자열.
+    """
+    return " ".join(query.split()).casefold()
+
+
+def _dedupe_results(results: List[Dict[str, Any]], top_k: Optional[int] = None) -> List[Dict[str, Any]]:
     """
     검색 결과의 중복을 제거합니다.
 
     URL을 기준으로 중복을 제거하며, 점수가 높은 결과를 유지합니다.
-    결과는 점수 기준 내림차순으로 정렬됩니다.
+    결과는 점수 기준 내림차순으로 정렬됩니다. top_k가 주어지면 전체 정렬 대신
+    힙으로 상위 top_k개만 선택합니다 (동점은 먼저 들어온 결과 우선, 정렬 결과와 동일).
 
     @param results 중복 제거할 검색 결과 리스트.
+    @param top_k 반환할 최대 결과 수 (None이면 전체).
     @returns 중복이 제거되고 정렬된 결과 리스트.
     """
     if not results:
         return []
 
-    # URL을 키로 사용하여 중복 제거
-    seen: Dict[str, Dict[str, Any]] = {}
+    # URL을 키로 사용하여 중복 제거 (점수는 한 번만 계산해 함께 보관)
+    seen: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 
     for item in results:
         url = str(item.get("url") or "").strip().lower()
@@ -674,14 +741,16 @@ def _dedupe_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         existing = seen.get(url)
 
         # 점수가 높은 결과를 유지
-        if existing is None or score > float(existing.get("score") or 0.0):
-            seen[url] = item
+        if existing is None or score > existing[0]:
+            seen[url] = (score, item)
 
     # 점수 기준 내림차순 정렬
-    merged = list(seen.values())
-    merged.sort(key=lambda x: float(x.get("score") or 0.0), reverse=True)
+    if top_k is not None and top_k < len(seen):
+        ranked = heapq.nlargest(top_k, seen.values(), key=itemgetter(0))
+    else:
+        ranked = sorted(seen.values(), key=itemgetter(0), reverse=True)
 
-    return merged
+    return [item for _, item in ranked]
 
 
 def merge_search_results(
@@ -699,5 +768,4 @@ def merge_search_results(
     for results in result_lists:
         all_results.extend(results)
 
-    deduped = _dedupe_results(all_results)
-    return deduped[:top_k]
+    return _dedupe_results(all_results, top_k=top_k)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 from typing import List, Optional
+
+from django.db.models import QuerySet
+
 from jagalchi_ai.ai_core.models import InitData
 
 
@@ -28,7 +31,13 @@ class InitDataService:
         """
         특정 로드맵의 Init 데이터 목록을 조회합니다.
         """
-        return list(InitData.objects.filter(roadmap_id=roadmap_id))
+        return list(self.get_queryset_by_roadmap(roadmap_id))
+
+    def get_queryset_by_roadmap(self, roadmap_id: str) -> QuerySet[InitData]:
+        """
+        특정 로드맵의 Init 데이터 쿼리셋을 평가하지 않은 채 반환합니다(페이지네이션용).
+        """
+        return InitData.objects.filter(roadmap_id=roadmap_id)
 
     def get_init_data(self, init_data_id: str) -> Optional[InitData]:
         """
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-from jagalchi_ai.ai_core.common.nlp.text_utils import cheap_embed, cosine_similarity, tokenize
+import numpy as np
+
+from jagalchi_ai.ai_core.common.nlp.text_utils import cached_cheap_embed_batch, cheap_embed, tokenize
+from jagalchi_ai.ai_core.domain.tech_stack import TechStack
 from jagalchi_ai.ai_core.repository.mock_data import TECH_STACKS
 from jagalchi_ai.ai_core.service.tags.tag_graph import TagGraph
 
 
+_DEPRECATED_RE = re.compile(r"deprecated|legacy")
+_ALIAS_SIMILARITY_THRESHOLD = 0.6
+
+
 class AutoTagger:
     """룰 기반 태그 자동 생성기."""
 
@@ -18,6 +28,7 @@ class AutoTagger:
         @returns {None} 내부 그래프를 구성합니다.
         """
         self._tag_graph = tag_graph or TagGraph()
+        self._alias_index = _alias_index()
 
     def tag_text(self, text: str) -> List[Dict[str, object]]:
         """
@@ -27,16 +38,19 @@ class AutoTagger:
         @returns {List[Dict[str, object]]} 태그 후보 목록.
         """
         tokens = tokenize(text)
+        token_counts = Counter(tokens)
         lowered = text.lower()
-        text_vec = cheap_embed(text)
+        text_vec: Optional[np.ndarray] = None
         tags = []
-        for tech in TECH_STACKS.values():
-            hits = sum(tokens.count(alias.lower()) for alias in tech.aliases)
+        for tech, lowered_aliases, alias_matrix in self._alias_index:
+            hits = sum(token_counts[alias] for alias in lowered_aliases)
             if hits == 0:
-                hits = sum(1 for alias in tech.aliases if alias.lower() in lowered)
-            if hits == 0:
-                alias_scores = [cosine_similarity(text_vec, cheap_embed(alias)) for alias in tech.aliases]
-                if alias_scores and max(alias_scores) >= 0.6:
+                hits = sum(1 for alias in lowered_aliases if alias in lowered)
+            if hits == 0 and len(alias_matrix):
+                if text_vec is None:
+                    text_vec = np.asarray(cheap_embed(text))
+                # 별칭/입력 벡터는 모두 L2 정규화되어 있어 내적이 곧 코사인 유사도다.
+                if (alias_matrix @ text_vec).max() >= _ALIAS_SIMILARITY_THRESHOLD:
                     hits = 1
             if hits == 0:
                 continue
@@ -60,6 +74,24 @@ class AutoTagger:
         return self._tag_graph.expand(tag)
 
 
+@lru_cache(maxsize=1)
+def _alias_index() -> Tuple[Tuple[TechStack, Tuple[str, ...], np.ndarray], ...]:
+    """
+    기술별 소문자 별칭과 별칭 임베딩 행렬을 한 번만 구성해 모든 태거가 공유합니다.
+
+    @returns {Tuple[Tuple[TechStack, Tuple[str, ...], np.ndarray], ...]} 기술, 소문자 별칭, 별칭 임베딩 행렬 묶음.
+    """
+    aliases = [alias for tech in TECH_STACKS.values() for alias in tech.aliases]
+    vectors = np.asarray(cached_cheap_embed_batch(aliases)).reshape(len(aliases), -1)
+    index = []
+    offset = 0
+    for tech in TECH_STACKS.values():
+        count = len(tech.aliases)
+        index.append((tech, tuple(alias.lower() for alias in tech.aliases), vectors[offset : offset + count]))
+        offset += count
+    return tuple(index)
+
+
 def _infer_tag_type(text: str, aliases: List[str]) -> str:
     """
     텍스트 맥락을 기반으로 태그 타입을 추정합니다.
@@ -68,12 +100,13 @@ def _infer_tag_type(text: str, aliases: List[str]) -> str:
     @param {List[str]} aliases - 기술 별칭 목록.
     @returns {str} 태그 타입 (core/optional/alternative/deprecated).
     """
+    if not aliases:
+        return "optional"
     lowered = text.lower()
-    for alias in aliases:
-        if f"{alias} deprecated" in lowered or "deprecated" in lowered or "legacy" in lowered:
-            return "deprecated"
-        if f"{alias} 대안" in lowered or "alternative" in lowered:
-            return "alternative"
+    if _DEPRECATED_RE.search(lowered):
+        return "deprecated"
+    if "alternative" in lowered or ("대안" in lowered and any(f"{alias} 대안" in lowered for alias in aliases)):
+        return "alternative"
     if any(alias in lowered for alias in aliases):
         return "core"
     return "optional"
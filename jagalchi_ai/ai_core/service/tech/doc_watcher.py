@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import hashlib
 import re
+from collections import OrderedDict
+from dataclasses import replace
 from difflib import SequenceMatcher
 
+from jagalchi_ai.ai_core.common.hashing import stable_hash_fields
 from jagalchi_ai.ai_core.common.nlp.text_utils import extractive_summary
 from jagalchi_ai.ai_core.domain.doc_change import DocChange
 
 
 _TAG_RE = re.compile(r"<[^>]+>")
+_DIFF_CACHE_MAXSIZE = 1024
 
 
 class DocWatcher:
@@ -22,6 +26,7 @@ class DocWatcher:
         @returns {None} 임계값을 저장합니다.
         """
         self._threshold = change_threshold
+        self._diff_cache: "OrderedDict[str, DocChange]" = OrderedDict()
 
     def checksum(self, content: str) -> str:
         """
@@ -36,6 +41,25 @@ class DocWatcher:
         """
         문서의 의미적 변경 여부를 계산합니다.
 
+        @param {str} before - 이전 문서 내용.
+        @param {str} after - 변경된 문서 내용.
+        @returns {DocChange} 변경 요약 결과.
+        """
+        key = stable_hash_fields([(before,), (after,)])
+        cached = self._diff_cache.get(key)
+        if cached is not None:
+            self._diff_cache.move_to_end(key)
+            return replace(cached)
+        change = self._compute_diff(before, after)
+        self._diff_cache[key] = replace(change)
+        if len(self._diff_cache) > _DIFF_CACHE_MAXSIZE:
+            self._diff_cache.popitem(last=False)
+        return change
+
+    def _compute_diff(self, before: str, after: str) -> DocChange:
+        """
+        캐시를 거치지 않고 문서 변경 요약을 계산합니다.
+
         @param {str} before - 이전 문서 내용.
         @param {str} after - 변경된 문서 내용.
         @returns {DocChange} 변경 요약 결과.
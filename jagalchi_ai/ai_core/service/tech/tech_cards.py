@@ -1,14 +1,24 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
+try:
+    from semantic_text_splitter import TextSplitter
+
+    SEMANTIC_SPLITTER_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    TextSplitter = None  # type: ignore
+    SEMANTIC_SPLITTER_AVAILABLE = False
+
 from jagalchi_ai.ai_core.client import GeminiClient
-from jagalchi_ai.ai_core.common.hashing import stable_hash_json
+from jagalchi_ai.ai_core.common.hashing import stable_hash_fields
 from jagalchi_ai.ai_core.common.nlp.summarization import map_reduce_summary
-from jagalchi_ai.ai_core.common.nlp.text_utils import cheap_embed, extractive_summary
+from jagalchi_ai.ai_core.common.nlp.text_utils import cached_cheap_embed, cached_cheap_embed_batch, extractive_summary
 from jagalchi_ai.ai_core.domain.source_chunk import SourceChunk
 from jagalchi_ai.ai_core.domain.vector_item import VectorItem
 from jagalchi_ai.ai_core.repository.in_memory_vector_store import InMemoryVectorStore
@@ -28,6 +38,8 @@ _ALTERNATIVE_MAP = {
     ],
 }
 _DEFAULT_SOURCE_SCORE = 0.45
+_CHUNK_OVERLAP = 40
+_SPLITTER_CACHE: Dict[int, Union["TextSplitter", RecursiveCharacterTextSplitter]] = {}
 
 
 class TechCardService:
@@ -82,7 +94,7 @@ class TechCardService:
         """
         chunks = self._chunk_sources(tech_slug, sources)
         _ = self._index_chunks(chunks)
-        summary = map_reduce_summary([source["content"] for source in sources])
+        summary = _cached_map_reduce_summary(tuple(source["content"] for source in sources))
         pitfalls = COMMON_PITFALLS.get(tech_slug, [])
         reel = self._reel.extract(sources)
         change_summary = self._detect_changes(sources)
@@ -128,7 +140,7 @@ class TechCardService:
             "tech_slug": tech_slug,
             "version": datetime.utcnow().date().isoformat(),
             "summary": summary,
-            "summary_vector": cheap_embed(summary),
+            "summary_vector": cached_cheap_embed(summary),
             "why_it_matters": why_it_matters,
             "when_to_use": when_to_use,
             "alternatives": alternatives,
@@ -187,17 +199,17 @@ class TechCardService:
         @param {List[Dict[str, str]]} sources - 소스 목록.
         @returns {str} 해시 문자열.
         """
-        normalized = []
-        for source in sources:
-            normalized.append(
-                {
-                    "title": source.get("title", ""),
-                    "url": source.get("url", ""),
-                    "content": extractive_summary(source.get("content", ""), max_sentences=2),
-                }
+        ordered = sorted(sources, key=lambda source: source.get("url", "") or source.get("title", ""))
+        records = [(tech_slug,)]
+        records.extend(
+            (
+                source.get("url", ""),
+                source.get("title", ""),
+                extractive_summary(source.get("content", ""), max_sentences=2),
             )
-        normalized.sort(key=lambda item: item["url"] or item["title"])
-        return stable_hash_json({"slug": tech_slug, "sources": normalized})
+            for source in ordered
+        )
+        return stable_hash_fields(records)
 
     def _calc_reliability(self, sources: List[Dict[str, str]]) -> Dict[str, object]:
         """
@@ -208,19 +220,22 @@ class TechCardService:
         """
         if not sources:
             return {"community_score": 40, "doc_freshness": 0, "source_count": 0}
-        scores = [float(source.get("score") or _DEFAULT_SOURCE_SCORE) for source in sources]
-        avg_score = sum(scores) / max(len(scores), 1)
-        freshness_scores = []
+        scores = np.fromiter(
+            (float(source.get("score") or _DEFAULT_SOURCE_SCORE) for source in sources),
+            dtype=np.float64,
+            count=len(sources),
+        )
+        avg_score = float(scores.mean())
         today = datetime.utcnow().date()
-        for source in sources:
-            fetched_at = source.get("fetched_at") or ""
-            try:
-                fetched_date = datetime.fromisoformat(fetched_at).date()
-            except ValueError:
-                continue
-            days = (today - fetched_date).days
-            freshness_scores.append(max(0, 100 - min(days, 100)))
-        doc_freshness = round(sum(freshness_scores) / len(freshness_scores)) if freshness_scores else 50
+        days = np.fromiter(
+            (
+                (today - fetched_date).days
+                for fetched_date in (_parse_fetched_date(source.get("fetched_at") or "") for source in sources)
+                if fetched_date is not None
+            ),
+            dtype=np.int64,
+        )
+        doc_freshness = round(float(np.maximum(0, 100 - np.minimum(days, 100)).mean())) if days.size else 50
         community_score = round(min(100, 40 + avg_score * 50 + len(sources) * 3))
         return {
             "community_score": community_score,
@@ -252,11 +267,9 @@ class TechCardService:
         @returns {List[SourceChunk]} 청킹된 조각 목록.
         """
         chunks: List[SourceChunk] = []
-        splitter = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=40)
-        for source_idx, source in enumerate(sources):
-            documents = splitter.create_documents([source["content"]])
-            for chunk_idx, document in enumerate(documents):
-                text = document.page_content
+        batches = _split_texts([source["content"] for source in sources], chunk_size)
+        for source_idx, texts in enumerate(batches):
+            for chunk_idx, text in enumerate(texts):
                 chunk_id = f"{tech_slug}:{source_idx}:{chunk_idx}"
                 chunks.append(
                     SourceChunk(
@@ -275,13 +288,14 @@ class TechCardService:
         @returns {InMemoryVectorStore} 인덱싱된 벡터 스토어.
         """
         store = InMemoryVectorStore()
+        vectors = cached_cheap_embed_batch([chunk.text for chunk in chunks])
         items = [
             VectorItem(
                 item_id=chunk.chunk_id,
-                vector=cheap_embed(chunk.text),
+                vector=vector,
                 metadata={**chunk.metadata, "text": chunk.text},
             )
-            for chunk in chunks
+            for chunk, vector in zip(chunks, vectors)
         ]
         store.batch_upsert(items)
         return store
@@ -290,18 +304,15 @@ class TechCardService:
         """
         URL 기준으로 중복 소스를 제거합니다.
 
+        URL이 없는 소스는 위치 인덱스를 키로 사용해 모두 유지하며, 처음 등장한 순서를 보존합니다.
+
         @param {List[Dict[str, str]]} sources - 소스 목록.
         @returns {List[Dict[str, str]]} 중복 제거된 소스 목록.
         """
-        seen = set()
-        deduped = []
-        for source in sources:
-            url = source.get("url", "")
-            if url and url in seen:
-                continue
-            seen.add(url)
-            deduped.append(source)
-        return deduped
+        by_key: Dict[Union[str, int], Dict[str, str]] = {}
+        for idx, source in enumerate(sources):
+            by_key.setdefault(source.get("url", "") or idx, source)
+        return list(by_key.values())
 
     def _compose_card_with_llm(
         self,
@@ -378,6 +389,67 @@ class TechCardService:
         return normalized
 
 
+@lru_cache(maxsize=256)
+def _cached_map_reduce_summary(contents: Tuple[str, ...]) -> str:
+    """
+    동일한 소스 본문 묶음의 Map-Reduce 요약을 재사용합니다.
+
+    @param {Tuple[str, ...]} contents - 소스 본문 튜플.
+    @returns {str} 요약 문자열.
+    """
+    return map_reduce_summary(list(contents))
+
+
+def _parse_fetched_date(fetched_at: str) -> Optional[date]:
+    """
+    수집 시각 문자열을 날짜로 변환합니다.
+
+    @param {str} fetched_at - ISO 형식 수집 시각.
+    @returns {Optional[date]} 변환된 날짜, 형식이 잘못되면 None.
+    """
+    try:
+        return datetime.fromisoformat(fetched_at).date()
+    except ValueError:
+        return None
+
+
+def _get_splitter(chunk_size: int) -> Union["TextSplitter", RecursiveCharacterTextSplitter]:
+    """
+    청크 크기별로 캐시된 텍스트 분할기를 반환합니다.
+
+    semantic-text-splitter(Rust)가 설치되어 있으면 우선 사용하고,
+    없으면 LangChain 분할기로 폴백합니다.
+
+    @param {int} chunk_size - 청크 크기.
+    @returns {Union[TextSplitter, RecursiveCharacterTextSplitter]} 재사용 가능한 분할기.
+    """
+    cached = _SPLITTER_CACHE.get(chunk_size)
+    if cached:
+        return cached
+    if SEMANTIC_SPLITTER_AVAILABLE:
+        splitter = TextSplitter(chunk_size, overlap=_CHUNK_OVERLAP)
+    else:
+        splitter = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=_CHUNK_OVERLAP)
+    _SPLITTER_CACHE[chunk_size] = splitter
+    return splitter
+
+
+def _split_texts(contents: List[str], chunk_size: int) -> List[List[str]]:
+    """
+    캐시된 분할기로 여러 문서를 한 번에 청크 문자열 목록으로 나눕니다.
+
+    @param {List[str]} contents - 분할할 문서 본문 목록.
+    @param {int} chunk_size - 청크 크기.
+    @returns {List[List[str]]} 입력 순서와 동일한 문서별 청크 목록.
+    """
+    if not contents:
+        return []
+    splitter = _get_splitter(chunk_size)
+    if SEMANTIC_SPLITTER_AVAILABLE:
+        return [list(chunks) for chunks in splitter.chunk_all(contents)]
+    return [splitter.split_text(content) for content in contents]
+
+
 def _normalize_card_payload(payload: Dict[str, object], fallback: Dict[str, object]) -> Dict[str, object]:
     """
     LLM 응답을 스키마에 맞게 정규화합니다.
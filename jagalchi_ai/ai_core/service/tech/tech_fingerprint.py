@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from datetime import datetime
 from typing import Dict, List, Optional
 
@@ -11,6 +12,9 @@ from jagalchi_ai.ai_core.repository.mock_data import TECH_STACKS
 from jagalchi_ai.ai_core.repository.snapshot_store import SnapshotStore
 
 
+_DEPRECATED_RE = re.compile(r"deprecated|legacy")
+
+
 class TechFingerprintService:
     """로드맵 기술 지문 자동 태깅 서비스."""
 
@@ -152,12 +156,13 @@ def _infer_tag_type(text: str, aliases: List[str]) -> str:
     @param {List[str]} aliases - 기술 별칭 목록.
     @returns {str} 태그 타입.
     """
+    if not aliases:
+        return "optional"
     lowered = text.lower()
-    for alias in aliases:
-        if f"{alias} deprecated" in lowered or "deprecated" in lowered or "legacy" in lowered:
-            return "deprecated"
-        if f"{alias} 대안" in lowered or "alternative" in lowered:
-            return "alternative"
+    if _DEPRECATED_RE.search(lowered):
+        return "deprecated"
+    if "alternative" in lowered or ("대안" in lowered and any(f"{alias} 대안" in lowered for alias in aliases)):
+        return "alternative"
     if any(alias in lowered for alias in aliases):
         if len(aliases) > 1 and aliases[0] in lowered:
             return "core"
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import List
 
+import numpy as np
+
 
 def ips_estimate(rewards: List[float], propensities: List[float]) -> float:
     """
@@ -13,9 +15,11 @@ def ips_estimate(rewards: List[float], propensities: List[float]) -> float:
     """
     if len(rewards) != len(propensities):
         raise ValueError("Rewards and propensities length mismatch")
-    total = 0.0
-    for reward, prop in zip(rewards, propensities):
-        if prop <= 0:
-            continue
-        total += reward / prop
-    return total / max(len(rewards), 1)
+    if not rewards:
+        return 0.0
+    reward_arr = np.asarray(rewards, dtype=np.float64)
+    prop_arr = np.asarray(propensities, dtype=np.float64)
+    if prop_arr[0] > 0 and np.all(prop_arr == prop_arr[0]):
+        return float(reward_arr.sum() / prop_arr[0] / reward_arr.size)
+    mask = prop_arr > 0
+    return float((reward_arr[mask] / prop_arr[mask]).sum() / reward_arr.size)
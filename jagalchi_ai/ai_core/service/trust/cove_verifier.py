@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Set
 
-from jagalchi_ai.ai_core.common.nlp.text_utils import extractive_summary, tokenize
+from jagalchi_ai.ai_core.common.nlp.text_utils import extractive_summary, token_set, tokenize
 
 
 class CoveVerifier:
@@ -18,13 +18,13 @@ class CoveVerifier:
         sentences = [s for s in draft.split(".") if s.strip()]
         verified = []
         unverified = []
-        evidence_tokens = []
+        evidence_tokens: Set[str] = set()
         for item in evidence:
-            evidence_tokens.extend(tokenize(item.get("snippet", "")))
+            evidence_tokens.update(tokenize(item.get("snippet", "")))
 
         for sentence in sentences:
-            tokens = set(tokenize(sentence))
-            if tokens and tokens.intersection(evidence_tokens):
+            tokens = token_set(sentence)
+            if tokens and not tokens.isdisjoint(evidence_tokens):
                 verified.append(sentence.strip())
             else:
                 unverified.append(sentence.strip())
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import cached_property
 from math import exp
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+import numpy as np
+from scipy.sparse import coo_matrix, csr_matrix, diags
 
 from jagalchi_ai.ai_core.domain.feedback import Feedback
 from jagalchi_ai.ai_core.repository.mock_data import USER_FEEDBACKS
@@ -19,30 +23,48 @@ class ReliabilityService:
         @returns {None} 내부 피드백을 설정합니다.
         """
         self._feedbacks = feedbacks or USER_FEEDBACKS
+        self._parsed_feedbacks = [Feedback(**item) for item in self._feedbacks]
+        self._users = sorted(
+            {f.from_user for f in self._parsed_feedbacks} | {f.to_user for f in self._parsed_feedbacks}
+        )
+        self._user_index = {user: idx for idx, user in enumerate(self._users)}
 
-    def compute_user_trust(self, iterations: int = 8, alpha: float = 0.15) -> Dict[str, float]:
+    def compute_user_trust(self, iterations: int = 8, alpha: float = 0.15, tol: float = 1e-6) -> Dict[str, float]:
         """
         EigenTrust 알고리즘으로 사용자 신뢰 점수를 계산합니다.
 
-        @param {int} iterations - 반복 횟수.
+        @param {int} iterations - 최대 반복 횟수.
         @param {float} alpha - 텔레포트 계수.
+        @param {float} tol - 이전 반복과의 L1 변화량이 이 값보다 작으면 조기 종료합니다.
         @returns {Dict[str, float]} 사용자별 신뢰 점수.
         """
-        feedbacks = [Feedback(**item) for item in self._feedbacks]
-        users = sorted({f.from_user for f in feedbacks} | {f.to_user for f in feedbacks})
+        users = self._users
         if not users:
             return {}
 
-        matrix = _build_local_trust(users, feedbacks)
-        trust = {user: 1.0 / len(users) for user in users}
+        transposed = self._transposed_trust
+        size = len(users)
+        trust = np.full(size, 1.0 / size)
 
         for _ in range(iterations):
-            next_trust = {user: alpha / len(users) for user in users}
-            for i, src in enumerate(users):
-                for j, dst in enumerate(users):
-                    next_trust[dst] += (1 - alpha) * matrix[i][j] * trust[src]
+            next_trust = alpha / size + (1 - alpha) * (transposed @ trust)
+            converged = np.abs(next_trust - trust).sum() < tol
             trust = next_trust
-        return trust
+            if converged:
+                break
+        return {user: float(score) for user, score in zip(users, trust)}
+
+    @cached_property
+    def _transposed_trust(self) -> csr_matrix:
+        """
+        전치된 로컬 트러스트 행렬을 한 번만 구성해 재사용합니다.
+
+        피드백은 생성 이후 변하지 않으므로 스냅샷 생성마다 행렬을 다시 만들지 않습니다.
+
+        @returns {csr_matrix} 전치된 행 정규화 로컬 트러스트 행렬.
+        """
+        matrix = _build_local_trust(self._users, self._parsed_feedbacks, index=self._user_index)
+        return matrix.T.tocsr()
 
     def content_score(self, author_trust: float, updated_at: datetime, decay_lambda: float = 0.01) -> float:
         """
@@ -71,31 +93,39 @@ class ReliabilityService:
         }
 
 
-def _build_local_trust(users: List[str], feedbacks: List[Feedback]) -> List[List[float]]:
+def _build_local_trust(
+    users: List[str],
+    feedbacks: List[Feedback],
+    index: Optional[Dict[str, int]] = None,
+) -> csr_matrix:
     """
-    사용자 간 로컬 트러스트 행렬을 구성합니다.
+    사용자 간 로컬 트러스트 행렬을 희소 행렬로 구성합니다.
+
+    피드백이 없는 사용자는 자기 자신에게 신뢰를 모두 부여합니다.
 
     @param {List[str]} users - 사용자 목록.
     @param {List[Feedback]} feedbacks - 피드백 목록.
-    @returns {List[List[float]]} 로컬 트러스트 행렬.
+    @param {Optional[Dict[str, int]]} index - 사용자별 행렬 인덱스(미지정 시 생성).
+    @returns {csr_matrix} 행 정규화된 로컬 트러스트 행렬.
     """
-    index = {user: idx for idx, user in enumerate(users)}
-    matrix = [[0.0 for _ in users] for _ in users]
-    row_sums = [0.0 for _ in users]
+    if index is None:
+        index = {user: idx for idx, user in enumerate(users)}
+    rows: List[int] = []
+    cols: List[int] = []
+    data: List[float] = []
 
     for feedback in feedbacks:
         score = max(feedback.positive - feedback.negative, 0)
         if score <= 0:
             continue
-        i = index[feedback.from_user]
-        j = index[feedback.to_user]
-        matrix[i][j] += score
-        row_sums[i] += score
-
-    for i in range(len(users)):
-        if row_sums[i] == 0:
-            matrix[i][i] = 1.0
-            continue
-        for j in range(len(users)):
-            matrix[i][j] = matrix[i][j] / row_sums[i]
-    return matrix
+        rows.append(index[feedback.from_user])
+        cols.append(index[feedback.to_user])
+        data.append(float(score))
+
+    size = len(users)
+    matrix = coo_matrix((data, (rows, cols)), shape=(size, size)).tocsr()
+    row_sums = np.asarray(matrix.sum(axis=1)).ravel()
+    empty_rows = row_sums == 0
+    inverse = np.divide(1.0, row_sums, out=np.zeros_like(row_sums), where=~empty_rows)
+    normalized = diags(inverse) @ matrix + diags(empty_rows.astype(np.float64))
+    return normalized.tocsr()
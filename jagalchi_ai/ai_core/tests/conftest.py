@@ -0,0 +1,32 @@
+from typing import Dict, List
+
+import pytest
+
+from jagalchi_ai.ai_core.domain.learning_record import LearningRecord
+from jagalchi_ai.ai_core.domain.roadmap import Roadmap
+
+
+@pytest.fixture(scope="session")
+def roadmaps() -> Dict[str, Roadmap]:
+    """
+    테스트 세션 전체에서 공유하는 목업 로드맵입니다.
+
+    서비스는 로드맵을 읽기만 하므로 복사 없이 공유합니다.
+
+    @returns {Dict[str, Roadmap]} 로드맵 ID별 로드맵.
+    """
+    from jagalchi_ai.ai_core.repository.mock_data import ROADMAPS
+
+    return ROADMAPS
+
+
+@pytest.fixture(scope="session")
+def learning_records() -> List[LearningRecord]:
+    """
+    테스트 세션 전체에서 공유하는 목업 학습 기록입니다.
+
+    @returns {List[LearningRecord]} 학습 기록 목록.
+    """
+    from jagalchi_ai.ai_core.repository.mock_data import LEARNING_RECORDS
+
+    return LEARNING_RECORDS
@@ -1,29 +1,200 @@
-import unittest
+from typing import Dict, List
 
-from jagalchi_ai.ai_core.repository.mock_data import LEARNING_RECORDS, ROADMAPS
-from jagalchi_ai.ai_core.repository.snapshot_store import SnapshotStore
-from jagalchi_ai.ai_core.service.record.record_coach import RecordCoachService
+from jagalchi_ai.ai_core.domain.learning_record import LearningRecord
+from jagalchi_ai.ai_core.domain.roadmap import Roadmap
 
 
-class CacheTests(unittest.TestCase):
-    def test_record_coach_cache_hit(self) -> None:
-        """
-        동일 입력에서 캐시가 히트되는지 검증합니다.
+def test_record_coach_cache_hit(roadmaps: Dict[str, Roadmap], learning_records: List[LearningRecord]) -> None:
+    """
+    동일 입력에서 캐시가 히트되는지 검증합니다.
 
-        @returns {None} 테스트만 수행합니다.
-        """
-        store = SnapshotStore()
-        service = RecordCoachService(snapshot_store=store)
-        record = LEARNING_RECORDS[0]
-        node = ROADMAPS[record.roadmap_id].nodes[-1]
+    @returns {None} 테스트만 수행합니다.
+    """
+    from jagalchi_ai.ai_core.repository.snapshot_store import SnapshotStore
+    from jagalchi_ai.ai_core.service.record.record_coach import RecordCoachService
 
-        service.get_feedback(record, node, tags=node.tags, compose_level="quick")
-        self.assertEqual(store.hits, 0)
-        self.assertEqual(store.misses, 1)
+    store = SnapshotStore()
+    service = RecordCoachService(snapshot_store=store)
+    record = learning_records[0]
+    node = roadmaps[record.roadmap_id].nodes[-1]
 
-        service.get_feedback(record, node, tags=node.tags, compose_level="quick")
-        self.assertEqual(store.hits, 1)
+    service.get_feedback(record, node, tags=node.tags, compose_level="quick")
+    assert store.hits == 0
+    assert store.misses == 1
 
+    service.get_feedback(record, node, tags=node.tags, compose_level="quick")
+    assert store.hits == 1
 
-if __name__ == "__main__":
-    unittest.main()
+
+def test_cache_snapshot_store_shares_backend() -> None:
+    """
+    Django 캐시 기반 스냅샷 저장소가 인스턴스 간에 스냅샷을 공유하는지 검증합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    from jagalchi_ai.ai_core.repository.cache_snapshot_store import CacheSnapshotStore
+
+    writer = CacheSnapshotStore(namespace="test_cache")
+    reader = CacheSnapshotStore(namespace="test_cache")
+    writer.get_or_create("key", version="v1", builder=lambda: {"value": 1})
+    snapshot = reader.get("key")
+    assert snapshot is not None
+    assert snapshot.payload == {"value": 1}
+    assert (writer.misses, reader.hits) == (1, 1)
+
+    writer.clear()
+    assert reader.get("key") is None
+
+
+def test_related_roadmaps_view_response_is_cached() -> None:
+    """
+    조회 API 응답이 캐시되어 두 번째 요청에서 뷰 로직을 다시 실행하지 않는지 검증합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    from unittest import mock
+
+    from django.core.cache import cache
+    from rest_framework.test import APIRequestFactory
+
+    from jagalchi_ai.ai_core.controller import ai_views
+
+    cache.clear()
+    factory = APIRequestFactory()
+    view = ai_views.RelatedRoadmapsAPIView.as_view()
+    with mock.patch.object(ai_views, "_related_roadmaps", wraps=ai_views._related_roadmaps) as spy:
+        first = view(factory.get("/ai/related-roadmaps", {"roadmap_id": "rm_frontend"}, HTTP_HOST="localhost"))
+        first.render()
+        second = view(factory.get("/ai/related-roadmaps", {"roadmap_id": "rm_frontend"}, HTTP_HOST="localhost"))
+    assert spy.call_count == 1
+    assert first.status_code == second.status_code == 200
+    assert second.content == first.content
+    assert "max-age=60" in first["Cache-Control"]
+    assert "Accept-Language" in first["Vary"]
+
+
+def test_schema_view_generates_schema_once() -> None:
+    """
+    스키마 뷰가 같은 (버전, 언어)에 대해 스키마를 한 번만 생성하는지 검증합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    from unittest import mock
+
+    from rest_framework.test import APIRequestFactory
+
+    from jagalchi_ai.ai_core.controller.docs_views import CachedSchemaAPIView
+
+    generator = mock.Mock()
+    generator.return_value.get_schema.return_value = {"openapi": "3.0.3", "paths": {}}
+    factory = APIRequestFactory()
+    with mock.patch.object(CachedSchemaAPIView, "generator_class", generator), mock.patch.dict(
+        CachedSchemaAPIView._schema_cache, clear=True
+    ):
+        view = CachedSchemaAPIView.as_view()
+        first = view(factory.get("/ai/schema/", {"format": "json"}, HTTP_HOST="localhost"))
+        second = view(factory.get("/ai/schema/", {"format": "json"}, HTTP_HOST="localhost"))
+        assert first.data == second.data == {"openapi": "3.0.3", "paths": {}}
+    assert generator.return_value.get_schema.call_count == 1
+
+
+def test_lmdb_snapshot_store_persists_across_instances(tmp_path) -> None:
+    """
+    LMDB 스냅샷 저장소가 다시 열어도 스냅샷을 유지하고 만료를 적용하는지 검증합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    import pytest
+
+    pytest.importorskip("lmdb")
+    from jagalchi_ai.ai_core.repository.lmdb_snapshot_store import LMDBSnapshotStore
+
+    path = tmp_path / "snapshots.lmdb"
+    writer = LMDBSnapshotStore(path, map_size=1 << 20)
+    writer.get_or_create("key", version="v1", builder=lambda: {"value": "값"}, metadata={"query": "react"})
+    writer.close()
+
+    reader = LMDBSnapshotStore(path, map_size=1 << 20)
+    snapshot = reader.get("key")
+    assert snapshot is not None
+    assert (snapshot.payload, snapshot.metadata, reader.hits) == ({"value": "값"}, {"query": "react"}, 1)
+    reader.clear()
+    assert reader.size() == 0
+    reader.close()
+
+    expiring = LMDBSnapshotStore(path, map_size=1 << 20, ttl_seconds=-1)
+    expiring.put("key", {"value": 1}, version="v1")
+    assert expiring.get("key") is None
+    expiring.close()
+
+
+def test_lmdb_snapshot_store_survives_full_map(tmp_path) -> None:
+    """
+    LMDB 맵이 가득 차도 put이 예외 없이 결과를 반환하고 만료 항목을 비우는지 검증합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    import pytest
+
+    pytest.importorskip("lmdb")
+    from jagalchi_ai.ai_core.repository.lmdb_snapshot_store import LMDBSnapshotStore
+
+    store = LMDBSnapshotStore(tmp_path / "snapshots.lmdb", map_size=1 << 16, ttl_seconds=-1)
+    for index in range(200):
+        snapshot = store.put(f"key-{index}", {"value": "x" * 512}, version="v1")
+        assert snapshot.payload["value"] == "x" * 512
+    assert store.evictions > 0
+    store.close()
+
+
+def test_web_search_snapshot_backend_follows_setting(tmp_path) -> None:
+    """
+    SNAPSHOT_BACKEND 설정에 따라 웹 검색 스냅샷 저장소가 선택되는지 검증합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    import pytest
+    from django.test import override_settings
+
+    pytest.importorskip("lmdb")
+    from jagalchi_ai.ai_core.controller import ai_views
+    from jagalchi_ai.ai_core.repository.cache_snapshot_store import CacheSnapshotStore
+    from jagalchi_ai.ai_core.repository.lmdb_snapshot_store import LMDBSnapshotStore
+
+    with override_settings(SNAPSHOT_BACKEND="cache"):
+        assert isinstance(ai_views._web_search_snapshot_store(), CacheSnapshotStore)
+
+    ai_views._lmdb_snapshot_store.cache_clear()
+    try:
+        with override_settings(SNAPSHOT_BACKEND="lmdb", LMDB_SNAPSHOT_PATH=tmp_path / "snapshots.lmdb"):
+            store = ai_views._web_search_snapshot_store()
+            assert isinstance(store, LMDBSnapshotStore)
+            assert ai_views._web_search_snapshot_store() is store
+            store.close()
+    finally:
+        ai_views._lmdb_snapshot_store.cache_clear()
+
+
+def test_throttle_uses_local_cache() -> None:
+    """
+    요청 제한 기록이 기본 캐시가 아닌 로컬 throttle 캐시에 저장되는지 검증합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    from django.core.cache import cache, caches
+    from rest_framework.test import APIRequestFactory
+    from rest_framework.views import APIView
+
+    from jagalchi_ai.ai_core.controller.throttling import LocalAnonRateThrottle
+    from jagalchi_ai.settings import get_env
+
+    cache.clear()
+    caches["throttle"].clear()
+    throttle = LocalAnonRateThrottle()
+    request = APIView().initialize_request(APIRequestFactory().get("/ai/health/", REMOTE_ADDR="10.0.0.1"))
+    assert throttle.allow_request(request, None)
+    key = throttle.get_cache_key(request, None)
+    assert len(caches["throttle"].get(key)) == 1
+    assert cache.get(key) is None
+    # 워커 로컬 기록이므로 전체 한도를 워커 수로 나눈 한도가 적용됩니다.
+    assert throttle.num_requests == max(1, 100 // get_env().WEB_CONCURRENCY)
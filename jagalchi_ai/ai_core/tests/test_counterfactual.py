@@ -0,0 +1,21 @@
+import unittest
+
+from jagalchi_ai.ai_core.service.trust.counterfactual import ips_estimate
+
+
+class CounterfactualTests(unittest.TestCase):
+    def test_ips_estimate(self) -> None:
+        """
+        IPS 추정치가 0 이하 확률을 건너뛰고 균일 확률에서도 동일하게 계산되는지 검증합니다.
+
+        @returns {None} 테스트만 수행합니다.
+        """
+        self.assertAlmostEqual(ips_estimate([1.0, 0.5, 1.0], [0.5, 0.0, 0.25]), (2.0 + 4.0) / 3)
+        self.assertAlmostEqual(ips_estimate([1.0, 0.0], [0.5, 0.5]), 1.0)
+        self.assertEqual(ips_estimate([], []), 0.0)
+        with self.assertRaises(ValueError):
+            ips_estimate([1.0], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,9 +6,6 @@ from jagalchi_ai.ai_core.common.schema_validation import (
     validate_resource_recommendation_output,
     validate_roadmap_generation_output,
 )
-from jagalchi_ai.ai_core.service.analytics.learning_analytics import LearningPatternService
-from jagalchi_ai.ai_core.service.graph.roadmap_generator import RoadmapGeneratorService
-from jagalchi_ai.ai_core.service.recommendation.resource_recommender import ResourceRecommendationService
 
 
 class ExtendedSchemaTests(unittest.TestCase):
@@ -18,6 +15,8 @@ class ExtendedSchemaTests(unittest.TestCase):
 
         @returns {None} 테스트만 수행합니다.
         """
+        from jagalchi_ai.ai_core.service.graph.roadmap_generator import RoadmapGeneratorService
+
         service = RoadmapGeneratorService()
         payload = service.generate("React 학습", preferred_tags=["react"], compose_level="quick")
         validate_roadmap_generation_output(payload)
@@ -28,6 +27,8 @@ class ExtendedSchemaTests(unittest.TestCase):
 
         @returns {None} 테스트만 수행합니다.
         """
+        from jagalchi_ai.ai_core.service.recommendation.resource_recommender import ResourceRecommendationService
+
         os.environ["AI_DISABLE_EXTERNAL"] = "true"
         try:
             service = ResourceRecommendationService()
@@ -42,6 +43,8 @@ class ExtendedSchemaTests(unittest.TestCase):
 
         @returns {None} 테스트만 수행합니다.
         """
+        from jagalchi_ai.ai_core.service.analytics.learning_analytics import LearningPatternService
+
         service = LearningPatternService()
         payload = service.analyze("user_1", days=14)
         validate_learning_pattern_output(payload)
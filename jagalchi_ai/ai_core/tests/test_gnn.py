@@ -1,7 +1,5 @@
 import unittest
 
-from jagalchi_ai.ai_core.service.graph.graph_sage import GraphSAGE
-
 
 class GnnTests(unittest.TestCase):
     def test_predict_next(self) -> None:
@@ -10,6 +8,8 @@ class GnnTests(unittest.TestCase):
 
         @returns {None} 테스트만 수행합니다.
         """
+        from jagalchi_ai.ai_core.service.graph.graph_sage import GraphSAGE
+
         model = GraphSAGE()
         node_text = {"a": "react", "b": "hooks", "c": "redux"}
         adjacency = {"a": ["b", "c"], "b": ["c"]}
@@ -1,7 +1,6 @@
 import unittest
 
 from jagalchi_ai.ai_core.common.schema_validation import validate_learning_coach_output
-from jagalchi_ai.ai_core.service.coach.learning_coach import LearningCoachService
 
 
 class LearningCoachTests(unittest.TestCase):
@@ -11,6 +10,8 @@ class LearningCoachTests(unittest.TestCase):
 
         @returns {None} 테스트만 수행합니다.
         """
+        from jagalchi_ai.ai_core.service.coach.learning_coach import LearningCoachService
+
         service = LearningCoachService()
         payload = service.answer("user_1", "진행 상황 알려줘")
         validate_learning_coach_output(payload)
@@ -0,0 +1,30 @@
+import json
+import logging
+from pathlib import Path
+
+from jagalchi_ai.ai_core.common.log_handlers import ORJSONFormatter, QueuedRotatingFileHandler
+
+
+def test_queued_file_handler_writes_json_lines(tmp_path: Path) -> None:
+    """
+    큐 핸들러가 리스너를 통해 JSON 한 줄 로그를 파일에 기록하는지 검증합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    log_file = tmp_path / "app.log"
+    handler = QueuedRotatingFileHandler(str(log_file), maxBytes=1024 * 1024, backupCount=1)
+    handler.setFormatter(ORJSONFormatter())
+    logger = logging.getLogger("jagalchi_ai.tests.log_handlers")
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        logger.warning("검색 %s건", 3, extra={"query": "react"})
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+    entry = json.loads(log_file.read_text(encoding="utf-8").strip())
+    assert entry["message"] == "검색 3건"
+    assert entry["levelname"] == "WARNING"
+    assert entry["name"] == "jagalchi_ai.tests.log_handlers"
+    assert entry["query"] == "react"
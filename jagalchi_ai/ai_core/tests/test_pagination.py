@@ -0,0 +1,33 @@
+import pytest
+
+
+@pytest.mark.django_db
+def test_init_data_list_is_cursor_paginated() -> None:
+    """
+    Init 데이터 목록이 최신순 커서 페이지로 나뉘어 반환되는지 검증합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    from rest_framework.test import APIClient
+
+    from jagalchi_ai.ai_core.controller.pagination import TimeCursorPagination
+    from jagalchi_ai.ai_core.models import InitData
+
+    total = TimeCursorPagination.page_size + 5
+    for idx in range(total):
+        InitData.objects.create(roadmap_id="rm-1", content=f"본문 {idx}")
+    InitData.objects.create(roadmap_id="rm-2", content="다른 로드맵")
+
+    client = APIClient()
+    first = client.get("/ai/init-data", {"roadmap_id": "rm-1"}).json()
+    assert len(first["results"]) == TimeCursorPagination.page_size
+    assert first["previous"] is None
+    second = client.get(first["next"]).json()
+    assert len(second["results"]) == 5
+    assert second["next"] is None
+
+    rows = first["results"] + second["results"]
+    assert {row["roadmap_id"] for row in rows} == {"rm-1"}
+    assert len({row["init_data_id"] for row in rows}) == total
+    created = [row["created_at"] for row in rows]
+    assert created == sorted(created, reverse=True)
@@ -1,5 +1,6 @@
 import unittest
 
+from jagalchi_ai.ai_core.service.recommendation.ranking import RankingFeature, score_candidate, score_candidates
 from jagalchi_ai.ai_core.service.recommendation.related_roadmaps import RelatedRoadmapsService
 
 
@@ -16,6 +17,21 @@ class RankingTests(unittest.TestCase):
         self.assertTrue(candidates)
         self.assertEqual(candidates[0]["related_roadmap_id"], "rm_react")
 
+    def test_score_candidates_matches_scalar(self) -> None:
+        """
+        벡터화된 후보 점수가 단건 점수 계산과 일치하는지 검증합니다.
+
+        @returns {None} 테스트만 수행합니다.
+        """
+        features = [
+            RankingFeature(2, 0.9, 0.4, 0.1, 0.3, 1.0),
+            RankingFeature(0, 0.5, 0.0, 0.5, 0.0, 0.5),
+        ]
+        scores = score_candidates(features)
+        for feature, score in zip(features, scores):
+            self.assertAlmostEqual(score, score_candidate(feature))
+        self.assertEqual(len(score_candidates([])), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
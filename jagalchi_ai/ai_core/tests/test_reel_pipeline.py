@@ -1,8 +1,6 @@
 import os
 import unittest
 
-from jagalchi_ai.ai_core.service.tech.reel_pipeline import ReelPipeline
-
 
 class ReelPipelineTests(unittest.TestCase):
     def test_reel_extract(self) -> None:
@@ -11,6 +9,8 @@ class ReelPipelineTests(unittest.TestCase):
 
         @returns {None} 테스트만 수행합니다.
         """
+        from jagalchi_ai.ai_core.service.tech.reel_pipeline import ReelPipeline
+
         sources = [
             {"title": "Doc", "content": "License: MIT v1.2.3 Language: Python", "fetched_at": "2025-01-01"}
         ]
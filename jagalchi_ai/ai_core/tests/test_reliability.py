@@ -18,6 +18,21 @@ class ReliabilityTests(unittest.TestCase):
         total = round(sum(scores.values()), 2)
         self.assertAlmostEqual(total, 1.0, places=1)
 
+    def test_eigentrust_without_positive_feedback(self) -> None:
+        """
+        긍정 피드백이 없는 사용자도 점수를 받고 합이 유지되는지 검증합니다.
+
+        @returns {None} 테스트만 수행합니다.
+        """
+        feedbacks = [
+            {"from_user": "a", "to_user": "b", "positive": 3, "negative": 1},
+            {"from_user": "b", "to_user": "c", "positive": 0, "negative": 2},
+        ]
+        scores = ReliabilityService(feedbacks).compute_user_trust()
+        self.assertEqual(sorted(scores), ["a", "b", "c"])
+        self.assertAlmostEqual(sum(scores.values()), 1.0, places=6)
+        self.assertGreater(scores["b"], scores["a"])
+
     def test_content_score(self) -> None:
         """
         콘텐츠 신뢰도 점수가 0 이상인지 확인합니다.
@@ -0,0 +1,44 @@
+import io
+import unittest
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from rest_framework.renderers import JSONRenderer
+
+from jagalchi_ai.ai_core.controller.parsers import ORJSONParser
+from jagalchi_ai.ai_core.controller.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(unittest.TestCase):
+    def test_render_matches_drf_json(self) -> None:
+        """
+        orjson 렌더러 출력이 DRF 기본 JSON 렌더러와 동일한지 검증합니다.
+
+        @returns {None} 테스트만 수행합니다.
+        """
+        payload = {
+            "query": "파이썬 설치 방법",
+            "generated_at": datetime(2025, 1, 1, 12, 30, 45, 123456, tzinfo=timezone.utc),
+            "day": date(2025, 1, 1),
+            "score": Decimal("0.75"),
+            "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "results": [{"title": "줄\u2028바꿈", "rank": 1}],
+            1: "non-str key",
+        }
+        self.assertEqual(ORJSONRenderer().render(payload), JSONRenderer().render(payload))
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+    def test_parser_round_trip(self) -> None:
+        """
+        orjson 파서가 렌더링 결과를 원래 데이터로 복원하는지 검증합니다.
+
+        @returns {None} 테스트만 수행합니다.
+        """
+        payload = {"query": "React 상태 관리", "top_k": 5, "tags": ["react", "zustand"]}
+        body = ORJSONRenderer().render(payload)
+        self.assertEqual(ORJSONParser().parse(io.BytesIO(body)), payload)
+
+
+if __name__ == "__main__":
+    unittest.main()
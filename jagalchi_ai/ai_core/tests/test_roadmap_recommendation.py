@@ -1,37 +1,65 @@
-import unittest
+from typing import Dict
+
+import pytest
 
 from jagalchi_ai.ai_core.domain.graph_edge import GraphEdge
-from jagalchi_ai.ai_core.repository.mock_data import ROADMAPS
-from jagalchi_ai.ai_core.service.graph.graph_ontology import GraphOntology
+from jagalchi_ai.ai_core.domain.roadmap import Roadmap
+from jagalchi_ai.ai_core.service.graph.graph_ontology import GraphOntology, cached_ontology
 from jagalchi_ai.ai_core.service.graph.roadmap_recommendation_service import RoadmapRecommendationService
 
 
-class RoadmapRecommendationTests(unittest.TestCase):
-    def test_recommendation_generates_nodes(self) -> None:
-        """
-        로드맵 추천 결과에 노드/예측이 포함되는지 검증합니다.
+def test_recommendation_generates_nodes(roadmaps: Dict[str, Roadmap]) -> None:
+    """
+    로드맵 추천 결과에 노드/예측이 포함되는지 검증합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    service = RoadmapRecommendationService(roadmaps)
+    payload = service.recommend("frontend_dev", "user_1")
+    assert payload["nodes"]
+    assert payload["target_role"] == "frontend_dev"
+    assert "gnn_predictions" in payload
+
+
+def test_cycle_detection() -> None:
+    """
+    그래프 사이클 감지가 동작하는지 검증합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    ontology = GraphOntology()
+    ontology.add_node("a", "skill")
+    ontology.add_node("b", "skill")
+    ontology.add_edge(GraphEdge(source="a", target="b"))
+    with pytest.raises(ValueError):
+        ontology.add_edge(GraphEdge(source="b", target="a"))
+
 
-        @returns {None} 테스트만 수행합니다.
-        """
-        service = RoadmapRecommendationService(ROADMAPS)
-        payload = service.recommend("frontend_dev", "user_1")
-        self.assertTrue(payload["nodes"])
-        self.assertEqual(payload["target_role"], "frontend_dev")
-        self.assertIn("gnn_predictions", payload)
+def test_cycle_detection_after_reordering() -> None:
+    """
+    역순으로 추가된 엣지로 위상 순서가 재배치된 뒤에도 사이클을 감지하는지 검증합니다.
 
-    def test_cycle_detection(self) -> None:
-        """
-        그래프 사이클 감지가 동작하는지 검증합니다.
+    @returns {None} 테스트만 수행합니다.
+    """
+    ontology = GraphOntology()
+    for node_id in ["a", "b", "c", "d"]:
+        ontology.add_node(node_id, "skill")
+    ontology.add_edge(GraphEdge(source="c", target="d"))
+    ontology.add_edge(GraphEdge(source="b", target="c"))
+    ontology.add_edge(GraphEdge(source="a", target="b"))
+    ontology.add_edge(GraphEdge(source="a", target="d"))
+    with pytest.raises(ValueError):
+        ontology.add_edge(GraphEdge(source="d", target="a"))
+    assert len(ontology.edges) == 4
 
-        @returns {None} 테스트만 수행합니다.
-        """
-        ontology = GraphOntology()
-        ontology.add_node("a", "skill")
-        ontology.add_node("b", "skill")
-        ontology.add_edge(GraphEdge(source="a", target="b"))
-        with self.assertRaises(ValueError):
-            ontology.add_edge(GraphEdge(source="b", target="a"))
 
+def test_ontology_is_reused_for_same_roadmaps(roadmaps: Dict[str, Roadmap]) -> None:
+    """
+    동일한 로드맵 구조로 생성한 서비스가 온톨로지를 재사용하는지 검증합니다.
 
-if __name__ == "__main__":
-    unittest.main()
+    @returns {None} 테스트만 수행합니다.
+    """
+    first = RoadmapRecommendationService(roadmaps)
+    second = RoadmapRecommendationService(dict(roadmaps))
+    assert first._ontology is second._ontology
+    assert cached_ontology({}) is not first._ontology
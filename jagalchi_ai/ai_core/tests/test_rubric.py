@@ -25,6 +25,20 @@ class RubricScoreTests(unittest.TestCase):
         self.assertEqual(scores["reproducibility_score"], 100)
         self.assertGreaterEqual(scores["quality_score"], 60)
 
+    def test_score_record_cache_tracks_link_status(self) -> None:
+        """
+        링크 상태가 달라지면 캐시된 점수를 재사용하지 않는지 검증합니다.
+
+        @returns {None} 테스트만 수행합니다.
+        """
+        link = LinkMeta(url="https://example.com/cache", is_public=True, status_code=200)
+        record = LearningRecord(record_id="rec_cache", memo="문제: 캐시", links=[link], node_id="node", roadmap_id="rm")
+        first = score_record(record)
+        first["evidence_level"] = -1
+        self.assertEqual(score_record(record)["evidence_level"], 3)
+        link.status_code = 404
+        self.assertEqual(score_record(record)["evidence_level"], 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,23 +1,20 @@
-import unittest
+from typing import Dict, List
 
 from jagalchi_ai.ai_core.common.schema_validation import validate_record_coach_output
-from jagalchi_ai.ai_core.repository.mock_data import LEARNING_RECORDS, ROADMAPS
-from jagalchi_ai.ai_core.service.record.record_coach import RecordCoachService
+from jagalchi_ai.ai_core.domain.learning_record import LearningRecord
+from jagalchi_ai.ai_core.domain.roadmap import Roadmap
 
 
-class SchemaValidationTests(unittest.TestCase):
-    def test_record_coach_schema(self) -> None:
-        """
-        학습 기록 코치 스키마를 검증합니다.
+def test_record_coach_schema(roadmaps: Dict[str, Roadmap], learning_records: List[LearningRecord]) -> None:
+    """
+    학습 기록 코치 스키마를 검증합니다.
 
-        @returns {None} 테스트만 수행합니다.
-        """
-        service = RecordCoachService()
-        record = LEARNING_RECORDS[0]
-        node = ROADMAPS[record.roadmap_id].nodes[-1]
-        output = service.get_feedback(record, node, tags=node.tags, compose_level="quick")
-        validate_record_coach_output(output)
+    @returns {None} 테스트만 수행합니다.
+    """
+    from jagalchi_ai.ai_core.service.record.record_coach import RecordCoachService
 
-
-if __name__ == "__main__":
-    unittest.main()
+    service = RecordCoachService()
+    record = learning_records[0]
+    node = roadmaps[record.roadmap_id].nodes[-1]
+    output = service.get_feedback(record, node, tags=node.tags, compose_level="quick")
+    validate_record_coach_output(output)
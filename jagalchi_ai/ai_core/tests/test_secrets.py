@@ -0,0 +1,23 @@
+from django.test import override_settings
+from pydantic import SecretStr
+
+from jagalchi_ai.ai_core.config import api_key
+
+
+def test_api_key_unwraps_secret_once() -> None:
+    """
+    SecretStr 설정을 평문으로 꺼내고, 설정되지 않은 키는 빈 문자열을 반환하는지 검증합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    secret = SecretStr("test-key")
+    api_key.cache_clear()
+    try:
+        with override_settings(GEMINI_API_KEY=secret, EXA_API_KEY=None):
+            assert api_key("GEMINI_API_KEY") == "test-key"
+            assert api_key("EXA_API_KEY") == ""
+            assert "test-key" not in repr(secret)
+        # 한 번 꺼낸 값은 메모이즈되어 설정 객체를 다시 조회하지 않습니다.
+        assert api_key("GEMINI_API_KEY") == "test-key"
+    finally:
+        api_key.cache_clear()
@@ -16,6 +16,56 @@ class SemanticCacheTests(unittest.TestCase):
         self.assertIsNotNone(entry)
         self.assertEqual(entry.answer, "설치 가이드")
 
+    def test_cache_hit_on_minor_edit(self) -> None:
+        """
+        공백/구두점만 다르거나 한 글자가 다른 질의도 캐시 히트하는지 검증합니다.
+
+        @returns {None} 테스트만 수행합니다.
+        """
+        cache = SemanticCache(threshold=0.99)
+        cache.set("파이썬 설치 방법", "설치 가이드", metadata={"user_id": "u1"})
+        cache.set("React 상태 관리 라이브러리 비교와 선택 기준 정리", "상태 관리 가이드", metadata={"user_id": "u1"})
+        self.assertEqual(cache.get("파이썬 설치방법?", metadata={"user_id": "u1"}).answer, "설치 가이드")
+        fuzzy = cache.get("React 상태 관리 라이브러리 비교와 선택 기준 정리함", metadata={"user_id": "u1"})
+        self.assertEqual(fuzzy.answer, "상태 관리 가이드")
+        self.assertIsNone(cache.get("파이썬 설치방법", metadata={"user_id": "u2"}))
+
+    def test_cache_hit_through_embedding(self) -> None:
+        """
+        정규화/편집 유사도 경로를 거치지 않고 임베딩 유사도만으로 히트하는지 검증합니다.
+
+        @returns {None} 테스트만 수행합니다.
+        """
+        cache = SemanticCache(threshold=0.9, recent_size=0)
+        cache.set("django orm query optimization", "ORM 가이드")
+        hit = cache.get("optimization query orm django")
+        self.assertIsNotNone(hit)
+        self.assertEqual(hit.answer, "ORM 가이드")
+
+    def test_fp16_index_keeps_top1_recall(self) -> None:
+        """
+        float16 양자화 인덱스가 float32 인덱스와 같은 최근접 항목을 반환하는지 검증합니다.
+
+        @returns {None} 테스트만 수행합니다.
+        """
+        from jagalchi_ai.ai_core.common.nlp.text_utils import cached_cheap_embed
+        from jagalchi_ai.ai_core.repository.in_memory_vector_store import InMemoryVectorStore
+
+        exact = InMemoryVectorStore()
+        quantized = InMemoryVectorStore(fp16_index=True)
+        topics = ["python", "django", "react", "docker", "kubernetes", "sql", "rust", "go"]
+        queries = [f"{topic} {action} 방법" for topic in topics for action in ("설치", "배포", "테스트", "최적화")]
+        for idx, query in enumerate(queries):
+            vector = cached_cheap_embed(query)
+            exact.upsert(f"q{idx}", vector=vector, metadata={})
+            quantized.upsert(f"q{idx}", vector=vector, metadata={})
+        for topic in topics:
+            probe = cached_cheap_embed(f"{topic} 사용 방법")
+            self.assertEqual(
+                [item.item_id for item in quantized.query(probe, top_k=3)],
+                [item.item_id for item in exact.query(probe, top_k=3)],
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,5 @@
 import unittest
 
-from jagalchi_ai.ai_core.common.nlp.summarization import textrank_sentences
-
 
 class SummarizationTests(unittest.TestCase):
     def test_textrank(self) -> None:
@@ -10,6 +8,8 @@ class SummarizationTests(unittest.TestCase):
 
         @returns {None} 테스트만 수행합니다.
         """
+        from jagalchi_ai.ai_core.common.nlp.summarization import textrank_sentences
+
         text = "React는 UI를 만든다. 컴포넌트 기반이다. 상태 관리를 이해해야 한다."
         sentences = textrank_sentences(text, top_n=2)
         self.assertEqual(len(sentences), 2)
@@ -14,6 +14,20 @@ class SurvivalAnalysisTests(unittest.TestCase):
         hazard = model.hazard({"motivation": 0.5, "ability": 0.5, "gap": 0.2})
         self.assertGreater(hazard, 0)
 
+    def test_hazard_batch_matches_scalar(self) -> None:
+        """
+        배치 위험도 계산이 단건 계산과 일치하고 미지정 특성을 무시하는지 검증합니다.
+
+        @returns {None} 테스트만 수행합니다.
+        """
+        model = CoxModel()
+        cohort = [{"motivation": 0.5, "ability": 0.5, "gap": 0.2}, {"gap": 1.0, "unknown": 3.0}, {}]
+        hazards = model.hazard_batch(cohort)
+        self.assertEqual(hazards.shape, (3,))
+        for features, hazard in zip(cohort, hazards):
+            self.assertAlmostEqual(hazard, model.hazard(features))
+        self.assertAlmostEqual(hazards[2], model.baseline_hazard)
+
 
 if __name__ == "__main__":
     unittest.main()
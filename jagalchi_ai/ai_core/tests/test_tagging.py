@@ -26,6 +26,19 @@ class TaggingTests(unittest.TestCase):
         slugs = [tag["tech_slug"] for tag in tags]
         self.assertIn("react", slugs)
 
+    def test_auto_tagger_shares_alias_index(self) -> None:
+        """
+        태거 인스턴스가 별칭 인덱스를 공유하고 토큰 빈도로 신뢰도를 계산하는지 검증합니다.
+
+        @returns {None} 테스트만 수행합니다.
+        """
+        first, second = AutoTagger(), AutoTagger()
+        self.assertIs(first._alias_index, second._alias_index)
+        tags = first.tag_text("redux redux django")
+        confidence = {tag["tech_slug"]: tag["confidence"] for tag in tags}
+        self.assertEqual(confidence["redux"], 1.0)
+        self.assertEqual(confidence["django"], 0.83)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from jagalchi_ai.ai_core.common.nlp.text_utils import (
+    _EMBED_CACHE,
+    cached_cheap_embed,
+    cached_cheap_embed_batch,
+    cheap_embed,
+    cheap_embed_batch,
+)
+
+
+class TextUtilsTests(unittest.TestCase):
+    def test_cheap_embed_batch_matches_single(self) -> None:
+        """
+        배치 임베딩 결과가 단건 임베딩과 동일한지 검증합니다.
+
+        @returns {None} 테스트만 수행합니다.
+        """
+        texts = ["React Hooks 가이드", "", "Django ORM"]
+        self.assertEqual(cheap_embed_batch(texts), [cheap_embed(text) for text in texts])
+        self.assertEqual(cheap_embed_batch([]), [])
+
+    def test_cached_cheap_embed_reuses_vector(self) -> None:
+        """
+        동일 텍스트 임베딩이 캐시에서 재사용되고 결과가 변하지 않는지 검증합니다.
+
+        @returns {None} 테스트만 수행합니다.
+        """
+        text = "캐시 대상 문장 cached embed"
+        first = cached_cheap_embed(f"  {text} ")
+        self.assertIn((text, 32), _EMBED_CACHE)
+        first.append(1.0)
+        vectors = cached_cheap_embed_batch([text, text])
+        self.assertEqual(vectors, [cheap_embed(text), cheap_embed(text)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,31 @@
-import unittest
+import threading
+from typing import Optional, Sequence
 
-from jagalchi_ai.ai_core.client import ExaResult, TavilyResult
+import pytest
+
+from jagalchi_ai.ai_core.client import ExaResult, ExaSearchOptions, TavilyResult
 from jagalchi_ai.ai_core.repository.snapshot_store import SnapshotStore
-from jagalchi_ai.ai_core.service.retrieval.web_search_service import WebSearchService
+from jagalchi_ai.ai_core.service.retrieval.web_search_service import WebSearchService, merge_search_results
+
+# 서비스는 결과 객체를 읽기만 하므로 고정 결과를 모듈 상수로 한 번만 만들어 공유합니다.
+_FAKE_TAVILY_RESULTS = (
+    TavilyResult(
+        title="React Docs",
+        url="https://react.dev",
+        content="React 공식 문서 요약",
+        score=0.91,
+        published_date="2025-01-01",
+    ),
+)
+_FAKE_EXA_RESULTS = (
+    ExaResult(
+        title="React Docs",
+        url="https://react.dev",
+        content="React Exa 요약",
+        score=0.95,
+        published_date="2025-01-02",
+    ),
+)
 
 
 class FakeTavilyClient:
@@ -14,6 +37,7 @@ class FakeTavilyClient:
         """
         self.calls = 0
 
+    @property
     def available(self) -> bool:
         """
         테스트 환경에서 사용 가능 여부를 반환합니다.
@@ -22,28 +46,28 @@ class FakeTavilyClient:
         """
         return True
 
-    def search(self, query: str, max_results: int = 5, include_raw_content: bool = False) -> list[TavilyResult]:
+    def search(
+        self,
+        query: str,
+        max_results: int = 5,
+        include_raw_content: bool = False,
+        days: Optional[int] = None,
+    ) -> Sequence[TavilyResult]:
         """
         테스트용 고정 검색 결과를 반환합니다.
 
         @param {str} query - 검색 쿼리.
         @param {int} max_results - 최대 결과 수.
         @param {bool} include_raw_content - 본문 포함 여부.
-        @returns {list[TavilyResult]} 고정된 검색 결과.
+        @param {Optional[int]} days - 최신 자료 필터 기간(일).
+        @returns {Sequence[TavilyResult]} 공유 고정 검색 결과.
         """
         self.calls += 1
-        return [
-            TavilyResult(
-                title="React Docs",
-                url="https://react.dev",
-                content="React 공식 문서 요약",
-                score=0.91,
-                published_date="2025-01-01",
-            )
-        ]
+        return _FAKE_TAVILY_RESULTS
 
 
 class DisabledTavilyClient:
+    @property
     def available(self) -> bool:
         """
         비활성 클라이언트 상태를 반환합니다.
@@ -52,13 +76,20 @@ class DisabledTavilyClient:
         """
         return False
 
-    def search(self, query: str, max_results: int = 5, include_raw_content: bool = False) -> list[TavilyResult]:
+    def search(
+        self,
+        query: str,
+        max_results: int = 5,
+        include_raw_content: bool = False,
+        days: Optional[int] = None,
+    ) -> list[TavilyResult]:
         """
         호출되면 안 되는 검색 메서드입니다.
 
         @param {str} query - 검색 쿼리.
         @param {int} max_results - 최대 결과 수.
         @param {bool} include_raw_content - 본문 포함 여부.
+        @param {Optional[int]} days - 최신 자료 필터 기간(일).
         @returns {list[TavilyResult]} 테스트 실패를 유발합니다.
         """
         raise AssertionError("검색이 호출되면 안 됩니다.")
@@ -81,24 +112,26 @@ class FakeExaClient:
         """
         return True
 
-    def search(self, query: str, max_results: int = 5) -> list[ExaResult]:
+    def search(self, query: str, max_results: int = 5) -> Sequence[ExaResult]:
         """
         테스트용 고정 검색 결과를 반환합니다.
 
         @param {str} query - 검색 쿼리.
         @param {int} max_results - 최대 결과 수.
-        @returns {list[ExaResult]} 고정된 검색 결과.
+        @returns {Sequence[ExaResult]} 공유 고정 검색 결과.
         """
         self.calls += 1
-        return [
-            ExaResult(
-                title="React Docs",
-                url="https://react.dev",
-                content="React Exa 요약",
-                score=0.95,
-                published_date="2025-01-02",
-            )
-        ]
+        return _FAKE_EXA_RESULTS
+
+    def search_with_options(self, query: str, options: ExaSearchOptions) -> Sequence[ExaResult]:
+        """
+        옵션 기반 검색도 동일한 고정 결과를 반환합니다.
+
+        @param {str} query - 검색 쿼리.
+        @param {ExaSearchOptions} options - 검색 옵션.
+        @returns {Sequence[ExaResult]} 공유 고정 검색 결과.
+        """
+        return self.search(query, max_results=options.num_results)
 
 
 class DisabledExaClient:
@@ -121,38 +154,215 @@ class DisabledExaClient:
         raise AssertionError("검색이 호출되면 안 됩니다.")
 
 
-class WebSearchTests(unittest.TestCase):
-    def test_web_search_cache_hit(self) -> None:
-        """
-        캐시 히트 시 외부 호출이 중복되지 않는지 검증합니다.
-
-        @returns {None} 테스트만 수행합니다.
-        """
-        store = SnapshotStore()
-        tavily = FakeTavilyClient()
-        exa = FakeExaClient()
-        service = WebSearchService(tavily_client=tavily, exa_client=exa, snapshot_store=store)
-        first = service.search("react docs", top_k=1)
-        second = service.search("react docs", top_k=1)
-        self.assertEqual(tavily.calls, 1)
-        self.assertEqual(exa.calls, 1)
-        self.assertEqual(first, second)
-        self.assertEqual(first[0]["source"], "exa")
-        self.assertEqual(store.hits, 1)
-
-    def test_web_search_unavailable(self) -> None:
-        """
-        모든 외부 검색이 비활성일 때 빈 결과를 반환하는지 확인합니다.
-
-        @returns {None} 테스트만 수행합니다.
-        """
-        service = WebSearchService(
-            tavily_client=DisabledTavilyClient(),
-            exa_client=DisabledExaClient(),
-        )
-        results = service.search("react docs", top_k=1)
-        self.assertEqual(results, [])
-
-
-if __name__ == "__main__":
-    unittest.main()
+@pytest.fixture(scope="module")
+def store() -> SnapshotStore:
+    """
+    모듈 단위로 공유하는 스냅샷 저장소입니다.
+
+    @returns {SnapshotStore} 공유 저장소.
+    """
+    return SnapshotStore()
+
+
+@pytest.fixture(scope="module")
+def tavily() -> FakeTavilyClient:
+    """
+    모듈 단위로 공유하는 Tavily 테스트 클라이언트입니다.
+
+    @returns {FakeTavilyClient} 공유 클라이언트.
+    """
+    return FakeTavilyClient()
+
+
+@pytest.fixture(scope="module")
+def exa() -> FakeExaClient:
+    """
+    모듈 단위로 공유하는 Exa 테스트 클라이언트입니다.
+
+    @returns {FakeExaClient} 공유 클라이언트.
+    """
+    return FakeExaClient()
+
+
+@pytest.fixture(scope="module")
+def service(tavily: FakeTavilyClient, exa: FakeExaClient, store: SnapshotStore) -> WebSearchService:
+    """
+    공유 클라이언트/저장소로 한 번만 구성하는 검색 서비스입니다.
+
+    @returns {WebSearchService} 공유 서비스.
+    """
+    return WebSearchService(tavily_client=tavily, exa_client=exa, snapshot_store=store)
+
+
+@pytest.fixture(autouse=True)
+def reset_counters(request: pytest.FixtureRequest) -> None:
+    """
+    테스트 간 호출 카운트와 캐시 상태가 섞이지 않도록 초기화합니다.
+
+    @returns {None} 공유 객체 상태를 초기화합니다.
+    """
+    if "service" not in request.fixturenames:
+        return
+    request.getfixturevalue("tavily").calls = 0
+    request.getfixturevalue("exa").calls = 0
+    request.getfixturevalue("store").clear()
+
+
+def test_web_search_cache_hit(
+    service: WebSearchService,
+    tavily: FakeTavilyClient,
+    exa: FakeExaClient,
+    store: SnapshotStore,
+) -> None:
+    """
+    캐시 히트 시 외부 호출이 중복되지 않는지 검증합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    first = service.search("react docs", top_k=1)
+    second = service.search("react docs", top_k=1)
+    assert tavily.calls == 1
+    assert exa.calls == 1
+    assert first == second
+    assert first[0]["source"] == "exa"
+    assert store.hits == 1
+    # 공유 고정 결과가 서비스에 의해 변경되지 않았는지 확인
+    assert (_FAKE_TAVILY_RESULTS[0].score, _FAKE_EXA_RESULTS[0].score) == (0.91, 0.95)
+
+
+def test_web_search_unavailable() -> None:
+    """
+    모든 외부 검색이 비활성일 때 빈 결과를 반환하는지 확인합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    service = WebSearchService(
+        tavily_client=DisabledTavilyClient(),
+        exa_client=DisabledExaClient(),
+    )
+    results = service.search("react docs", top_k=1)
+    assert results == []
+
+
+def test_web_search_normalized_query_reuses_snapshot(
+    service: WebSearchService,
+    tavily: FakeTavilyClient,
+    store: SnapshotStore,
+) -> None:
+    """
+    대소문자/공백만 다른 쿼리가 같은 스냅샷을 재사용하는지 검증합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    first = service.search("React  Docs", top_k=1)
+    second = service.search(" react docs ", top_k=1)
+    assert first == second
+    assert tavily.calls == 1
+    assert store.hits == 1
+
+
+def test_web_search_does_not_cache_engine_failure() -> None:
+    """
+    한 엔진이 실패한 부분 결과는 스냅샷으로 저장하지 않고 다음 요청에서 다시 검색하는지 검증합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+
+    class FailingExaClient(FakeExaClient):
+        def search(self, *args, **kwargs) -> Sequence[ExaResult]:
+            """
+            @returns {Sequence[ExaResult]} 항상 예외를 발생시킵니다.
+            """
+            self.calls += 1
+            raise TimeoutError("exa timeout")
+
+    exa = FailingExaClient()
+    store = SnapshotStore()
+    service = WebSearchService(tavily_client=FakeTavilyClient(), exa_client=exa, snapshot_store=store)
+    payload = service.search_with_metadata("react docs", top_k=1)
+    assert payload["failed_engines"] == ["exa"]
+    assert payload["results"][0]["source"] == "tavily"
+    assert store.size() == 0
+    service.search("react docs", top_k=1)
+    assert exa.calls == 2
+
+
+def test_snapshot_store_evicts_least_recently_used() -> None:
+    """
+    최대 개수를 넘으면 가장 오래 사용되지 않은 스냅샷이 축출되는지 검증합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    store = SnapshotStore(max_entries=2)
+    store.put("a", {"value": 1}, version="v1")
+    store.put("b", {"value": 2}, version="v1")
+    assert store.get("a") is not None
+    store.put("c", {"value": 3}, version="v1")
+    assert store.size() == 2
+    assert store.evictions == 1
+    assert store.get("b") is None
+    assert store.get("a") is not None
+
+
+def test_web_search_queries_engines_concurrently() -> None:
+    """
+    Tavily와 Exa 검색이 동시에 수행되는지 검증합니다.
+
+    두 클라이언트가 같은 Barrier에서 만나야 결과를 반환하므로, 순차 호출이면
+    Barrier가 시간 초과되어 결과가 비게 됩니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BarrierTavilyClient(FakeTavilyClient):
+        def search(self, *args, **kwargs) -> Sequence[TavilyResult]:
+            """
+            다른 엔진 검색과 만난 뒤 고정 결과를 반환합니다.
+
+            @returns {Sequence[TavilyResult]} 공유 고정 검색 결과.
+            """
+            barrier.wait()
+            return super().search(*args, **kwargs)
+
+    class BarrierExaClient(FakeExaClient):
+        def search(self, *args, **kwargs) -> Sequence[ExaResult]:
+            """
+            다른 엔진 검색과 만난 뒤 고정 결과를 반환합니다.
+
+            @returns {Sequence[ExaResult]} 공유 고정 검색 결과.
+            """
+            barrier.wait()
+            return super().search(*args, **kwargs)
+
+    service = WebSearchService(
+        tavily_client=BarrierTavilyClient(),
+        exa_client=BarrierExaClient(),
+        snapshot_store=SnapshotStore(),
+    )
+    payload = service.search_with_metadata("react docs", top_k=1, use_cache=False)
+    assert payload["total_results_before_dedup"] == 2
+    assert payload["results"][0]["source"] == "exa"
+
+
+def test_merge_search_results_keeps_best_per_url() -> None:
+    """
+    URL 중복은 점수가 높은 결과만 남기고, 상위 top_k개를 점수순으로 반환하는지 검증합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    tavily_results = [
+        {"url": "https://react.dev", "score": 0.91, "source": "tavily"},
+        {"url": "https://vuejs.org", "score": 0.5, "source": "tavily"},
+        {"url": "https://svelte.dev", "score": 0.7, "source": "tavily"},
+    ]
+    exa_results = [
+        {"url": "https://React.dev ", "score": 0.95, "source": "exa"},
+        {"url": "https://angular.dev", "score": 0.7, "source": "exa"},
+    ]
+    merged = merge_search_results(tavily_results, exa_results, top_k=3)
+    assert [(item["url"], item["source"]) for item in merged] == [
+        ("https://React.dev ", "exa"),
+        ("https://svelte.dev", "tavily"),
+        ("https://angular.dev", "exa"),
+    ]
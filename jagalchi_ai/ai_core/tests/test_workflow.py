@@ -1,19 +1,23 @@
-import unittest
+import pytest
 
 from jagalchi_ai.ai_core.service.coach.simple_workflow import SimpleWorkflow
 
 
-class WorkflowTests(unittest.TestCase):
-    def test_workflow_plan(self) -> None:
-        """
-        워크플로우 실행 계획이 기대 순서인지 검증합니다.
+@pytest.fixture(scope="module")
+def workflow() -> SimpleWorkflow:
+    """
+    모듈 단위로 공유하는 워크플로우입니다 (테스트마다 다른 세션 ID를 사용).
 
-        @returns {None} 테스트만 수행합니다.
-        """
-        workflow = SimpleWorkflow()
-        plan = workflow.run("session1", "concept", ["graph_explorer"])
-        self.assertEqual(plan, ["route", "retrieve", "compose"])
+    @returns {SimpleWorkflow} 공유 워크플로우.
+    """
+    return SimpleWorkflow()
 
 
-if __name__ == "__main__":
-    unittest.main()
+def test_workflow_plan(workflow: SimpleWorkflow) -> None:
+    """
+    워크플로우 실행 계획이 기대 순서인지 검증합니다.
+
+    @returns {None} 테스트만 수행합니다.
+    """
+    plan = workflow.run("session1", "concept", ["graph_explorer"])
+    assert plan == ["route", "retrieve", "compose"]
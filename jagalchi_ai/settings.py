@@ -27,8 +27,9 @@ from __future__ import annotations
 
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Literal, Optional, Tuple
 
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -50,8 +51,8 @@ class EnvSettings(BaseSettings):
         description="Django 시크릿 키"
     )
     DJANGO_DEBUG: bool = Field(default=False, description="디버그 모드")
-    DJANGO_ALLOWED_HOSTS: List[str] = Field(
-        default=["localhost", "127.0.0.1", "0.0.0.0"],
+    DJANGO_ALLOWED_HOSTS: Tuple[str, ...] = Field(
+        default=("localhost", "127.0.0.1", "0.0.0.0"),
         description="허용 호스트 목록"
     )
 
@@ -63,6 +64,7 @@ class EnvSettings(BaseSettings):
     DATABASE_HOST: str = ""
     DATABASE_PORT: str = ""
     DATABASE_CONN_MAX_AGE: int = 60
+    DATABASE_CONN_HEALTH_CHECKS: bool = True  # 재사용 전 연결 상태 확인 (유휴 후 끊긴 연결 교체)
 
     # AI 클라이언트 설정
     GEMINI_API_KEY: Optional[SecretStr] = None
@@ -75,14 +77,21 @@ class EnvSettings(BaseSettings):
     AI_TIMEOUT: int = 30
     AI_MAX_RETRIES: int = 3
 
-    # 캐시 (Redis) 설정
+    # 캐시 (Redis / Memcached) 설정
     REDIS_URL: Optional[str] = None
+    MEMCACHED_LOCATION: Optional[str] = None  # 예: "127.0.0.1:11211"
     CACHE_TIMEOUT: int = 300
     CACHE_MAX_ENTRIES: int = 1000
+    CACHE_KEY_PREFIX: str = "jagalchi"  # 블루/그린 배포 간 키 공간 분리
+    CACHE_VERSION: int = 1  # 증가시키면 기존 캐시 전체 무효화
+
+    # 웹 검색 스냅샷 저장소 ("cache": CACHES 공유 캐시, "lmdb": 호스트 로컬 LMDB 파일)
+    SNAPSHOT_BACKEND: Literal["cache", "lmdb"] = "cache"
+    LMDB_SNAPSHOT_PATH: Optional[str] = None  # 미지정 시 BASE_DIR/snapshots.lmdb
 
     # CORS 설정
-    CORS_ALLOWED_ORIGINS: List[str] = Field(
-        default=["http://localhost:3000", "http://127.0.0.1:3000"],
+    CORS_ALLOWED_ORIGINS: Tuple[str, ...] = Field(
+        default=("http://localhost:3000", "http://127.0.0.1:3000"),
         description="CORS 허용 오리진"
     )
 
@@ -90,6 +99,9 @@ class EnvSettings(BaseSettings):
     SECURE_SSL_REDIRECT: bool = False
     SECURE_HSTS_SECONDS: int = 31536000
 
+    # gunicorn 워커 수 (gunicorn도 같은 환경변수를 기본 워커 수로 사용)
+    WEB_CONCURRENCY: int = 1  # 단일 프로세스(runserver) 기본값. Dockerfile/compose에서 4로 지정
+
     # 로깅 레벨
     LOG_LEVEL: str = "INFO"
 
@@ -97,12 +109,24 @@ class EnvSettings(BaseSettings):
         env_file=BASE_DIR / ".env",
         env_file_encoding="utf-8",
         extra="ignore",  # 정의되지 않은 환경변수는 무시
-        case_sensitive=True
+        case_sensitive=True,
+        frozen=True,  # 로드 이후 변경 금지 (런타임 설정 오염 방지)
     )
 
+
+@lru_cache(maxsize=1)
+def get_env() -> EnvSettings:
+    """
+    `.env` 파싱과 Pydantic 검증을 프로세스당 한 번만 수행하고 같은 인스턴스를 재사용합니다.
+
+    테스트 등에서 환경변수를 바꾼 뒤 다시 로드해야 하면 `get_env.cache_clear()`를 호출합니다.
+    """
+    return EnvSettings()
+
+
 # 설정 로드 (싱글톤)
 try:
-    env = EnvSettings()
+    env = get_env()
 except Exception as e:
     # 설정 로드 실패 시 치명적 오류로 간주하고 프로세스 종료
     print(f"=================================================================")
@@ -119,7 +143,7 @@ except Exception as e:
 
 SECRET_KEY = env.DJANGO_SECRET_KEY.get_secret_value()
 DEBUG = env.DJANGO_DEBUG
-ALLOWED_HOSTS = env.DJANGO_ALLOWED_HOSTS
+ALLOWED_HOSTS = list(env.DJANGO_ALLOWED_HOSTS)
 
 # -----------------------------------------------------------------------------
 # 애플리케이션 정의
@@ -141,19 +165,19 @@ INSTALLED_APPS = [
     "jagalchi_ai.ai_core",
 ]
 
+# AI 엔드포인트는 무상태 JSON API이므로 세션/메시지/인증 미들웨어를 두지 않습니다.
+# (인증은 DRF 인증 클래스가 담당합니다.) 정적 파일은 개발 모드에서 runserver가 서빙하므로
+# WhiteNoise는 운영 환경에서만 추가합니다.
 MIDDLEWARE = [
     # 보안 (가장 먼저)
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",  # 정적 파일
-    
+    *(() if DEBUG else ("whitenoise.middleware.WhiteNoiseMiddleware",)),  # 정적 파일
+
     # CORS (CommonMiddleware보다 먼저)
     "corsheaders.middleware.CorsMiddleware",
-    
-    "django.contrib.sessions.middleware.SessionMiddleware",
+
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
@@ -190,6 +214,7 @@ DATABASES = {
         "HOST": env.DATABASE_HOST,
         "PORT": env.DATABASE_PORT,
         "CONN_MAX_AGE": env.DATABASE_CONN_MAX_AGE,
+        "CONN_HEALTH_CHECKS": env.DATABASE_CONN_HEALTH_CHECKS,
     }
 }
 
@@ -224,7 +249,7 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # CORS 설정
 # -----------------------------------------------------------------------------
 CORS_ALLOW_ALL_ORIGINS = DEBUG  # 개발 모드일 때만 전체 허용
-CORS_ALLOWED_ORIGINS = env.CORS_ALLOWED_ORIGINS
+CORS_ALLOWED_ORIGINS = list(env.CORS_ALLOWED_ORIGINS)
 CORS_ALLOW_CREDENTIALS = True
 CORS_ALLOW_METHODS = ["DELETE", "GET", "OPTIONS", "PATCH", "POST", "PUT"]
 CORS_ALLOW_HEADERS = [
@@ -235,27 +260,39 @@ CORS_ALLOW_HEADERS = [
 # -----------------------------------------------------------------------------
 # Django REST Framework
 # -----------------------------------------------------------------------------
+# 렌더러 구성은 설정 로드 시 한 번만 결정합니다. 운영(DEBUG=False)에서는 JSON 렌더러만 사용해
+# Browsable API HTML 렌더링/콘텐츠 협상 비용이 발생하지 않도록 합니다.
+_RENDERER_CLASSES = ("jagalchi_ai.ai_core.controller.renderers.ORJSONRenderer",) + (
+    ("rest_framework.renderers.BrowsableAPIRenderer",) if DEBUG else ()
+)
+
+# 요청 제한 기록은 워커 로컬 캐시에 있으므로(아래 CACHES["throttle"]) 전체 한도를 워커 수로
+# 나눠 워커별 한도로 적용합니다. 요청이 여러 워커에 나뉘어도 합계가 전체 한도를 넘지 않습니다.
+# 단, --max-requests로 워커가 재시작되면 그 워커의 기록은 초기화됩니다.
+_THROTTLE_WORKERS = max(1, env.WEB_CONCURRENCY)
+
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "UNICODE_JSON": True,  # 한글 깨짐 방지
     "DEFAULT_PARSER_CLASSES": [
-        "rest_framework.parsers.JSONParser",
+        "jagalchi_ai.ai_core.controller.parsers.ORJSONParser",
         "rest_framework.parsers.FormParser",
         "rest_framework.parsers.MultiPartParser",
     ],
-    "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
-    ] + (["rest_framework.renderers.BrowsableAPIRenderer"] if DEBUG else []),
+    "DEFAULT_RENDERER_CLASSES": _RENDERER_CLASSES,
+    # 세션 미들웨어가 없으므로 SessionAuthentication(및 CSRF 검사)은 사용하지 않습니다.
+    "DEFAULT_AUTHENTICATION_CLASSES": ["rest_framework.authentication.BasicAuthentication"],
     "EXCEPTION_HANDLER": "rest_framework.views.exception_handler",
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    # 커서 페이지네이션: COUNT(*)/OFFSET 없이 created_at 인덱스 범위 조회로 페이지를 가져옵니다.
+    "DEFAULT_PAGINATION_CLASS": "jagalchi_ai.ai_core.controller.pagination.TimeCursorPagination",
     "PAGE_SIZE": 20,
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.AnonRateThrottle",
-        "rest_framework.throttling.UserRateThrottle",
+        "jagalchi_ai.ai_core.controller.throttling.LocalAnonRateThrottle",
+        "jagalchi_ai.ai_core.controller.throttling.LocalUserRateThrottle",
     ],
     "DEFAULT_THROTTLE_RATES": {
-        "anon": "100/hour",
-        "user": "1000/hour",
+        "anon": f"{max(1, 100 // _THROTTLE_WORKERS)}/hour",
+        "user": f"{max(1, 1000 // _THROTTLE_WORKERS)}/hour",
     },
 }
 
@@ -273,6 +310,9 @@ SPECTACULAR_SETTINGS = {
 # -----------------------------------------------------------------------------
 # 로깅 (Logging)
 # -----------------------------------------------------------------------------
+# 로그 디렉토리 생성은 설정 import 시점이 아니라 AppConfig.ready()에서 프로세스당 한 번 수행합니다.
+LOG_DIR = BASE_DIR / "logs"
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -288,8 +328,7 @@ LOGGING = {
             "datefmt": "%Y-%m-%d %H:%M:%S",
         },
         "json": {
-            "()": "pythonjsonlogger.jsonlogger.JsonFormatter",
-            "format": "%(asctime)s %(levelname)s %(name)s %(message)s",
+            "()": "jagalchi_ai.ai_core.common.log_handlers.ORJSONFormatter",
         },
     },
     "handlers": {
@@ -299,10 +338,11 @@ LOGGING = {
             "formatter": "verbose" if DEBUG else "simple",
             "stream": sys.stdout,
         },
+        # 파일 I/O는 첫 기록 시 시작하는 백그라운드 리스너가 수행합니다.
         "file": {
             "level": "INFO",
-            "class": "logging.handlers.RotatingFileHandler",
-            "filename": BASE_DIR / "logs" / "jagalchi.log",
+            "class": "jagalchi_ai.ai_core.common.log_handlers.QueuedRotatingFileHandler",
+            "filename": LOG_DIR / "jagalchi.log",
             "maxBytes": 10 * 1024 * 1024,
             "backupCount": 5,
             "formatter": "json",
@@ -314,33 +354,71 @@ LOGGING = {
         "": {"handlers": ["console"], "level": env.LOG_LEVEL},
     },
 }
-(BASE_DIR / "logs").mkdir(exist_ok=True)
+# 파일 핸들러는 로거에 연결하지 않습니다. 운영 로그는 gunicorn이 stdout으로 수집하며,
+# 여러 워커가 같은 파일을 RotatingFileHandler로 로테이션하면 기록이 유실되기 때문입니다.
+# 개발 모드에서는 파일 핸들러 자체를 만들지 않습니다.
+if DEBUG:
+    del LOGGING["handlers"]["file"]
 
 # -----------------------------------------------------------------------------
 # 캐시 설정
 # -----------------------------------------------------------------------------
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "unique-snowflake",
-        "TIMEOUT": env.CACHE_TIMEOUT,
-        "OPTIONS": {"MAX_ENTRIES": env.CACHE_MAX_ENTRIES},
-    }
+# 워커 간 캐시 공유를 위해 Redis > Memcached 순으로 사용하고,
+# 둘 다 없을 때만 프로세스 로컬 LocMemCache로 폴백합니다.
+_CACHE_COMMON = {
+    "TIMEOUT": env.CACHE_TIMEOUT,
+    "KEY_PREFIX": env.CACHE_KEY_PREFIX,
+    "VERSION": env.CACHE_VERSION,
 }
 
 if env.REDIS_URL:
-    CACHES["default"] = {
-        "BACKEND": "django.core.cache.backends.redis.RedisCache",
-        "LOCATION": env.REDIS_URL,
-        "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": env.REDIS_URL,
+            **_CACHE_COMMON,
+        }
     }
+elif env.MEMCACHED_LOCATION:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.memcached.PyMemcacheCache",
+            "LOCATION": env.MEMCACHED_LOCATION,
+            "OPTIONS": {"no_delay": True, "ignore_exc": True, "use_pooling": True},
+            **_CACHE_COMMON,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "unique-snowflake",
+            "OPTIONS": {"MAX_ENTRIES": env.CACHE_MAX_ENTRIES},
+            **_CACHE_COMMON,
+        }
+    }
+
+# 요청 제한(throttle) 기록은 워커 로컬 메모리에 둡니다. 모든 요청마다 공유 캐시에
+# GET/SET 왕복이 생기지 않는 대신 제한은 워커 단위로 적용됩니다.
+CACHES["throttle"] = {
+    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    "LOCATION": "throttle",
+    "OPTIONS": {"MAX_ENTRIES": 10000},
+}
+
+# 웹 검색 스냅샷 저장소. "lmdb"는 lmdb 패키지가 설치되어 있어야 합니다.
+SNAPSHOT_BACKEND = env.SNAPSHOT_BACKEND
+CACHE_TIMEOUT = env.CACHE_TIMEOUT  # LMDB 스냅샷도 공유 캐시와 같은 시간 후 만료
+LMDB_SNAPSHOT_PATH = Path(env.LMDB_SNAPSHOT_PATH) if env.LMDB_SNAPSHOT_PATH else BASE_DIR / "snapshots.lmdb"
 
 # -----------------------------------------------------------------------------
 # AI 관련 설정 (전역 변수로 노출)
 # -----------------------------------------------------------------------------
-GEMINI_API_KEY = env.GEMINI_API_KEY.get_secret_value() if env.GEMINI_API_KEY else ""
-TAVILY_API_KEY = env.TAVILY_API_KEY.get_secret_value() if env.TAVILY_API_KEY else ""
-EXA_API_KEY = env.EXA_API_KEY.get_secret_value() if env.EXA_API_KEY else ""
+# API 키는 SecretStr 그대로 노출해 repr/로그에서 마스킹을 유지합니다.
+# 평문이 필요한 곳에서는 `jagalchi_ai.ai_core.config.api_key("GEMINI_API_KEY")`로 꺼냅니다.
+GEMINI_API_KEY = env.GEMINI_API_KEY
+TAVILY_API_KEY = env.TAVILY_API_KEY
+EXA_API_KEY = env.EXA_API_KEY
 
 AI_DISABLE_LLM = env.AI_DISABLE_LLM
 AI_DISABLE_EXTERNAL = env.AI_DISABLE_EXTERNAL
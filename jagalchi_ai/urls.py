@@ -1,79 +1,56 @@
 from django.urls import path
+from django.views.decorators.cache import cache_page
 
-from drf_spectacular.views import SpectacularAPIView
-
-from jagalchi_ai.ai_core.controller.docs_views import RedocUIView, SwaggerUIView
-
-from jagalchi_ai.ai_core.controller.ai_views import (
-    CommentDigestAPIView,
-    CommentDuplicateAPIView,
-    DemoAIAPIView,
-    DocumentRoadmapAPIView,
-    GraphRAGAPIView,
-    HealthCheckAPIView,
-    LearningCoachAPIView,
-    LearningPatternAPIView,
-    RecordCoachAPIView,
-    RelatedRoadmapsAPIView,
-    ResourceRecommendationAPIView,
-    RoadmapGeneratedAPIView,
-    RoadmapRecommendationAPIView,
-    TechCardAPIView,
-    TechFingerprintAPIView,
-    WebSearchAPIView,
-    InitDataDetailAPIView,
-    InitDataListCreateAPIView,
-    NodeDescriptionAPIView,
-    NodeGenerationFromInitAPIView,
-    NodeResourceRecommendationAPIView,
-    NodeResourceSaveAPIView,
-)
+from jagalchi_ai.ai_core.controller.docs_views import CachedSchemaAPIView, RedocUIView, SwaggerUIView
+from jagalchi_ai.ai_core.controller.lazy_views import lazy_view
 
+# ai_views는 서비스/외부 클라이언트를 연쇄 임포트하므로, 뷰는 라우트가 처음 호출될 때 로드합니다.
 urlpatterns = [
     # OpenAPI 스키마 및 문서
-    path("ai/schema/", SpectacularAPIView.as_view(), name="schema"),
+    # 스키마는 배포 단위로 고정이므로 1시간 캐시
+    path("ai/schema/", cache_page(3600)(CachedSchemaAPIView.as_view()), name="schema"),
     path("ai/docs/", SwaggerUIView.as_view(), name="swagger-ui"),
     path("ai/redoc/", RedocUIView.as_view(), name="redoc"),
 
-    # 헬스체크 API
-    path("ai/health/", HealthCheckAPIView.as_view(), name="health-check"),
+    # 헬스체크 API (프로브 폭주를 흡수하도록 5초 캐시)
+    path("ai/health/", lazy_view("HealthCheckAPIView", decorators=(cache_page(5),)), name="health-check"),
 
     # AI 데모 API
-    path("ai/demo", DemoAIAPIView.as_view()),
+    path("ai/demo", lazy_view("DemoAIAPIView")),
 
     # 학습 코치 관련 API
-    path("ai/record-coach", RecordCoachAPIView.as_view()),
-    path("ai/learning-coach", LearningCoachAPIView.as_view()),
-    path("ai/learning-pattern", LearningPatternAPIView.as_view()),
+    path("ai/record-coach", lazy_view("RecordCoachAPIView")),
+    path("ai/learning-coach", lazy_view("LearningCoachAPIView")),
+    path("ai/learning-pattern", lazy_view("LearningPatternAPIView")),
 
     # 로드맵 관련 API
-    path("ai/related-roadmaps", RelatedRoadmapsAPIView.as_view()),
-    path("ai/roadmap-generated", RoadmapGeneratedAPIView.as_view()),
-    path("ai/roadmap-recommendation", RoadmapRecommendationAPIView.as_view()),
-    path("ai/document-roadmap", DocumentRoadmapAPIView.as_view()),
+    path("ai/related-roadmaps", lazy_view("RelatedRoadmapsAPIView")),
+    path("ai/roadmap-generated", lazy_view("RoadmapGeneratedAPIView")),
+    path("ai/roadmap-recommendation", lazy_view("RoadmapRecommendationAPIView")),
+    path("ai/document-roadmap", lazy_view("DocumentRoadmapAPIView")),
 
     # 기술 카드 API
-    path("ai/tech-cards", TechCardAPIView.as_view()),
-    path("ai/tech-fingerprint", TechFingerprintAPIView.as_view()),
+    path("ai/tech-cards", lazy_view("TechCardAPIView")),
+    path("ai/tech-fingerprint", lazy_view("TechFingerprintAPIView")),
 
     # 코멘트 관련 API
-    path("ai/comment-digest", CommentDigestAPIView.as_view()),
-    path("ai/comment-duplicates", CommentDuplicateAPIView.as_view()),
+    path("ai/comment-digest", lazy_view("CommentDigestAPIView")),
+    path("ai/comment-duplicates", lazy_view("CommentDuplicateAPIView")),
 
     # 검색 및 추천 API
-    path("ai/resource-recommendation", ResourceRecommendationAPIView.as_view()),
-    path("ai/web-search", WebSearchAPIView.as_view()),
+    path("ai/resource-recommendation", lazy_view("ResourceRecommendationAPIView")),
+    path("ai/web-search", lazy_view("WebSearchAPIView")),
 
     # GraphRAG API
-    path("ai/graph-rag", GraphRAGAPIView.as_view()),
+    path("ai/graph-rag", lazy_view("GraphRAGAPIView")),
 
     # Init Data API
-    path("ai/init-data", InitDataListCreateAPIView.as_view()),
-    path("ai/init-data/<str:init_data_id>", InitDataDetailAPIView.as_view()),
+    path("ai/init-data", lazy_view("InitDataListCreateAPIView")),
+    path("ai/init-data/<str:init_data_id>", lazy_view("InitDataDetailAPIView")),
 
     # Node Content API
-    path("ai/node-generation", NodeGenerationFromInitAPIView.as_view()),
-    path("ai/node-description", NodeDescriptionAPIView.as_view()),
-    path("ai/node-resource-recommendation", NodeResourceRecommendationAPIView.as_view()),
-    path("ai/node-resource-save", NodeResourceSaveAPIView.as_view()),
+    path("ai/node-generation", lazy_view("NodeGenerationFromInitAPIView")),
+    path("ai/node-description", lazy_view("NodeDescriptionAPIView")),
+    path("ai/node-resource-recommendation", lazy_view("NodeResourceRecommendationAPIView")),
+    path("ai/node-resource-save", lazy_view("NodeResourceSaveAPIView")),
 ]